@@ -2,8 +2,9 @@ import json
 import os
 import logging
 import re
+import hashlib
+import threading
 from typing import Optional, Dict, List, Tuple
-from datetime import datetime
 
 try:
     import google.generativeai as genai
@@ -29,14 +30,8 @@ try:
 except ImportError:
     CLAUDE_AVAILABLE = False
 
-try:
-    import wandb
-    WANDB_AVAILABLE = True
-except ImportError:
-    WANDB_AVAILABLE = False
-
 from config.llm_config import (
-    LLM_PROVIDERS, ENABLE_WANDB, 
+    LLM_PROVIDERS,
     LOG_FILE, LOG_LEVEL, MAX_LLM_RETRIES, LLM_TIMEOUT
 )
 
@@ -50,15 +45,9 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+_console_lock = threading.Lock()
 
-# Setup wandb
-if ENABLE_WANDB and WANDB_AVAILABLE:
-    try:
-        wandb.init(project="zip-puzzle-llm", name=f"session-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
-        logger.info("wandb initialized successfully")
-    except Exception as e:
-        logger.warning(f"Failed to initialize wandb: {e}")
-        WANDB_AVAILABLE = False
+# wandb runs are started by whoever logs metrics (see LLMMetricsCollector.log_to_wandb)
 
 class ZipPuzzlePromptEngine:
     """Expert-engineered prompt system for ZIP puzzle solving"""
@@ -209,6 +198,19 @@ MOVE: (1,1)
 Solve the puzzle step by step, providing your THINKING and MOVE each time. Remember to consider future implications of your current move on completing the entire puzzle. You must returen your move in coordinate system (row, column). and it only have positive co-ordinates similar to the Matrix form"""
 
         return prompt
+    
+    @staticmethod
+    def multi_move_instructions(moves_ahead: int) -> str:
+        """Prompt addendum asking for a sequence of up to moves_ahead moves"""
+        return f"""
+
+=== MULTIPLE MOVES ===
+Instead of a single MOVE, plan your next {moves_ahead} moves from the current position.
+After your THINKING, list them in order on one line, each adjacent to the one before:
+
+MOVES: (row,col) -> (row,col) -> ...
+
+Give fewer moves if you are unsure beyond a point. The first move must be one of the Available Next Moves."""
 
 class LLMSolver:
     """Enhanced LLM solver with thinking process and multiple API support"""
@@ -217,6 +219,15 @@ class LLMSolver:
         self.provider = None
         self.model = None
         self.prompt_engine = ZipPuzzlePromptEngine()
+        # API clients by provider, kept across moves so their HTTP connection
+        # pools (and TLS sessions) are reused instead of reconnecting per call
+        self._clients: Dict[str, object] = {}
+        self._warmed: set = set()  # providers whose connection warmup() has opened
+        # Parsed-OK replies by hash of (provider, model, prompt); None = caching off
+        self.response_cache: Optional[Dict[str, str]] = None
+        self._response_cache_file: Optional[str] = None
+        # Parallel batch games share this solver; guards client creation and cache writes
+        self._lock = threading.Lock()
         
     def set_provider(self, provider_name: str):
         """Set the LLM provider"""
@@ -231,19 +242,105 @@ class LLMSolver:
         self.model = config.get("model")
         logger.info(f"LLM provider set to: {provider_name} (model: {self.model})")
     
+    def enable_response_cache(self, cache_file: Optional[str] = None):
+        """Reuse earlier replies to identical prompts instead of calling the LLM again,
+        loading any replies saved in cache_file by save_response_cache()"""
+        self.response_cache = {}
+        self._response_cache_file = cache_file
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self.response_cache = json.load(f)
+                logger.info(f"Loaded {len(self.response_cache)} cached LLM responses from {cache_file}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable LLM response cache {cache_file}: {e}")
+    
+    def save_response_cache(self):
+        """Write the response cache back to its file, if it has one"""
+        if self.response_cache is None or not self._response_cache_file:
+            return
+        tmp = self._response_cache_file + ".tmp"
+        with self._lock:
+            data = json.dumps(self.response_cache)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, self._response_cache_file)
+    
+    def _response_cache_key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{self.provider}\0{self.model}\0{prompt}".encode('utf-8')).hexdigest()
+    
+    def warmup(self):
+        """Open the connection to the current provider with a cheap request, so the
+        first move isn't charged for the TCP/TLS handshake. Best effort and once per
+        provider: any failure is left for the first real call to report."""
+        if not self.provider or self.provider in self._warmed:
+            return
+        self._warmed.add(self.provider)
+        
+        try:
+            if self.provider == "gemini":
+                self._gemini_model()
+                next(iter(genai.list_models()), None)
+            elif self.provider == "ollama" and OLLAMA_AVAILABLE:
+                import ollama
+                ollama.list()
+            elif self.provider == "openai":
+                self._openai_client().models.list()
+            elif self.provider == "claude":
+                self._claude_client().models.list(limit=1)
+        except Exception as e:
+            logger.debug(f"Warm-up request to {self.provider} failed: {e}")
+    
+    def _gemini_model(self):
+        """Configured Gemini model, created on first use"""
+        with self._lock:
+            model = self._clients.get("gemini")
+            if model is None:
+                if not GEMINI_AVAILABLE:
+                    raise RuntimeError("Gemini not available. Install: pip install google-generativeai")
+                
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise RuntimeError("GEMINI_API_KEY environment variable not set")
+                
+                genai.configure(api_key=api_key)
+                model_name = LLM_PROVIDERS["gemini"].get("model", "gemini-2.0-flash")
+                model = self._clients["gemini"] = genai.GenerativeModel(model_name)
+        return model
+    
+    def _openai_client(self):
+        """OpenAI client, created on first use"""
+        with self._lock:
+            client = self._clients.get("openai")
+            if client is None:
+                if not OPENAI_AVAILABLE:
+                    raise RuntimeError("OpenAI not available. Install: pip install openai")
+                
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    raise RuntimeError("OPENAI_API_KEY environment variable not set")
+                
+                client = self._clients["openai"] = openai.OpenAI(api_key=api_key)
+        return client
+    
+    def _claude_client(self):
+        """Anthropic client, created on first use"""
+        with self._lock:
+            client = self._clients.get("claude")
+            if client is None:
+                if not CLAUDE_AVAILABLE:
+                    raise RuntimeError("Claude not available. Install: pip install anthropic")
+                
+                api_key = os.getenv("CLAUDE_API_KEY")
+                if not api_key:
+                    raise RuntimeError("CLAUDE_API_KEY environment variable not set")
+                
+                client = self._clients["claude"] = anthropic.Anthropic(api_key=api_key)
+        return client
+    
     def _call_gemini_api(self, prompt: str) -> str:
         """Call Gemini API"""
-        if not GEMINI_AVAILABLE:
-            raise RuntimeError("Gemini not available. Install: pip install google-generativeai")
-        
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise RuntimeError("GEMINI_API_KEY environment variable not set")
-        
-        genai.configure(api_key=api_key)
-        model_name = LLM_PROVIDERS["gemini"].get("model", "gemini-2.0-flash")
-        model = genai.GenerativeModel(model_name)
-        
+        model = self._gemini_model()
         response = model.generate_content(prompt)
         return response.text
     
@@ -259,14 +356,7 @@ class LLMSolver:
     
     def _call_openai_api(self, prompt: str) -> str:
         """Call OpenAI ChatGPT API"""
-        if not OPENAI_AVAILABLE:
-            raise RuntimeError("OpenAI not available. Install: pip install openai")
-        
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY environment variable not set")
-        
-        client = openai.OpenAI(api_key=api_key)
+        client = self._openai_client()
         model_name = LLM_PROVIDERS["openai"].get("model", "gpt-4")
         
         response = client.chat.completions.create(
@@ -284,14 +374,7 @@ class LLMSolver:
     
     def _call_claude_api(self, prompt: str) -> str:
         """Call Anthropic Claude API"""
-        if not CLAUDE_AVAILABLE:
-            raise RuntimeError("Claude not available. Install: pip install anthropic")
-        
-        api_key = os.getenv("CLAUDE_API_KEY")
-        if not api_key:
-            raise RuntimeError("CLAUDE_API_KEY environment variable not set")
-        
-        client = anthropic.Anthropic(api_key=api_key)
+        client = self._claude_client()
         model_name = LLM_PROVIDERS["claude"].get("model", "claude-3-sonnet-20240229")
         
         response = client.messages.create(
@@ -330,7 +413,7 @@ class LLMSolver:
         coordinates = None
         
         # Strategy 1: Look for structured THINKING: and MOVE: format
-        thinking_match = re.search(r'THINKING:\s*(.*?)\s*MOVE:', response_text, re.DOTALL | re.IGNORECASE)
+        thinking_match = re.search(r'THINKING:\s*(.*?)\s*MOVES?:', response_text, re.DOTALL | re.IGNORECASE)
         if thinking_match:
             thinking = thinking_match.group(1).strip()
         
@@ -370,37 +453,51 @@ class LLMSolver:
         
         return thinking, coordinates
     
+    def _extract_move_sequence(self, response_text: str, limit: int) -> List[Tuple[int, int]]:
+        """Extract the coordinates listed after MOVES:, at most limit of them"""
+        moves_match = re.search(r'MOVES:\s*(.*)', response_text, re.DOTALL | re.IGNORECASE)
+        if not moves_match:
+            return []
+        pairs = re.findall(r'\((\d+),\s*(\d+)\)', moves_match.group(1))
+        return [(int(r), int(c)) for r, c in pairs[:limit]]
+    
     def _log_thinking_process(self, move_number: int, thinking: str, coordinates: Optional[Tuple[int, int]]):
         """Log the LLM's thinking process in detail"""
         
-        logger.info("=" * 80)
-        logger.info(f"🧠 LLM THINKING PROCESS - Move {move_number}")
-        logger.info("=" * 80)
-        logger.info(f"Provider: {self.provider}")
-        logger.info(f"Model: {self.model}")
-        logger.info("-" * 40)
-        logger.info("REASONING:")
-        logger.info(thinking)
-        logger.info("-" * 40)
-        if coordinates:
-            logger.info(f"DECISION: Move to {coordinates}")
-        else:
-            logger.info("DECISION: No valid move extracted")
-        logger.info("=" * 80)
-        
-        # Also print to console for immediate visibility
-        print(f"\n🧠 {self.provider.upper()} THINKING (Move {move_number}):")
-        print("-" * 50)
-        print(thinking)
-        print("-" * 50)
-        if coordinates:
-            print(f"💡 DECISION: {coordinates}")
-        else:
-            print("❌ DECISION: Could not extract move")
-        print()
+        # Skip building the log lines when INFO is off (the console copy below always prints)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 80)
+            logger.info(f"🧠 LLM THINKING PROCESS - Move {move_number}")
+            logger.info("=" * 80)
+            logger.info(f"Provider: {self.provider}")
+            logger.info(f"Model: {self.model}")
+            logger.info("-" * 40)
+            logger.info("REASONING:")
+            logger.info(thinking)
+            logger.info("-" * 40)
+            if coordinates:
+                logger.info(f"DECISION: Move to {coordinates}")
+            else:
+                logger.info("DECISION: No valid move extracted")
+            logger.info("=" * 80)
+        
+        # Also print to console for immediate visibility (one block per move,
+        # even when batch games run in parallel)
+        with _console_lock:
+            print(f"\n🧠 {self.provider.upper()} THINKING (Move {move_number}):")
+            print("-" * 50)
+            print(thinking)
+            print("-" * 50)
+            if coordinates:
+                print(f"💡 DECISION: {coordinates}")
+            else:
+                print("❌ DECISION: Could not extract move")
+            print()
     
-    def solve(self, board, path: List[Tuple[int, int]], next_number: int) -> Optional[Dict]:
-        """Solve using expert prompt engineering with detailed thinking process"""
+    def solve(self, board, path: List[Tuple[int, int]], next_number: int, moves_ahead: int = 1) -> Optional[Dict]:
+        """Solve using expert prompt engineering with detailed thinking process.
+        With moves_ahead > 1 the LLM is asked for a sequence of moves; they are
+        returned in order under "next_moves" ("next_move" is the first)."""
         
         if not self.provider:
             raise ValueError("No LLM provider selected")
@@ -410,17 +507,25 @@ class LLMSolver:
         
         # Generate expert prompt
         prompt = self.prompt_engine.generate_expert_prompt(board, path)
+        if moves_ahead > 1:
+            prompt += self.prompt_engine.multi_move_instructions(moves_ahead)
         
         logger.info(f"📋 EXPERT PROMPT for Move {move_number}:")
         logger.info("=" * 60)
         logger.info(prompt)
         logger.info("=" * 60)
         
+        cache_key = self._response_cache_key(prompt) if self.response_cache is not None else None
+        
         # Try multiple times with retries
         for attempt in range(MAX_LLM_RETRIES):
             try:
-                # Call LLM
-                response_text = self._call_llm_api(prompt)
+                # Call LLM (a cached reply only stands in for the first attempt)
+                response_text = self.response_cache.get(cache_key) if cache_key and attempt == 0 else None
+                if response_text is not None:
+                    logger.info("♻️ Using cached LLM response for this prompt")
+                else:
+                    response_text = self._call_llm_api(prompt)
                 
                 logger.info(f"📝 LLM RAW RESPONSE (Attempt {attempt + 1}):")
                 logger.info("-" * 40)
@@ -429,6 +534,11 @@ class LLMSolver:
                 
                 # Extract thinking and coordinates
                 thinking, coordinates = self._extract_thinking_and_move(response_text)
+                sequence = self._extract_move_sequence(response_text, moves_ahead) if moves_ahead > 1 else []
+                if sequence:
+                    coordinates = sequence[0]
+                elif coordinates:
+                    sequence = [coordinates]
                 
                 # Log thinking process in detail
                 self._log_thinking_process(move_number, thinking, coordinates)
@@ -436,9 +546,13 @@ class LLMSolver:
                 if coordinates:
                     row, col = coordinates
                     logger.info(f"✅ SUCCESSFULLY PARSED MOVE: ({row}, {col})")
+                    if cache_key:
+                        with self._lock:
+                            self.response_cache[cache_key] = response_text
                     
                     return {
                         "next_move": {"row": row, "col": col},
+                        "next_moves": [{"row": r, "col": c} for r, c in sequence],
                         "thinking": thinking,
                         "reason": thinking[:200] + "..." if len(thinking) > 200 else thinking,
                         "confidence": 0.8,
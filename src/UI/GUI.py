@@ -3,12 +3,13 @@ import os  # Added import os
 import pygame
 import random
 import math
+import threading
 from typing import List, Optional, Tuple
 
 from core.board import Board, Coord, validate_path
 from core.solver import solve_backtracking
 from UI.animation import Animator
-from UI.style import draw_cell_circle, draw_gradient_polyline, random_gradient_colors
+from UI.style import draw_cell_circle, draw_gradient_polyline, draw_gradient_segment, random_gradient_colors
 from config.config import *
 
 ARROW_COLOR = (255, 215, 0)
@@ -192,6 +193,8 @@ class Game:
         
         self.screen = pygame.display.set_mode((w, h))
         pygame.display.set_caption(f"ZIP Puzzle - {board_size}x{board_size}")
+        # Set once run() has shown its first frame; LLM threads wait on it
+        self.gui_ready = threading.Event()
         
         # Victory celebration and transition
         self.victory_animation = VictoryAnimation(w, h)
@@ -232,6 +235,24 @@ class Game:
 
         # Modern buttons setup - mode specific
         self._setup_modern_buttons()
+
+        # Static window background (white + checkered grid cells), blitted each frame
+        self._bg_surface = self._build_background()
+
+        # Committed path is rasterized into its own layer; only new segments get drawn
+        grid_px = board.n * self.cell
+        self._path_origin = self.to_screen(0, 0)[:2]
+        self._path_surface = pygame.Surface((grid_px, grid_px), pygame.SRCALPHA).convert_alpha()
+        self._path_drawn: List[Coord] = []
+        # draw_grid also runs on the LLM thread; hold this while syncing/blitting the layer
+        self._path_lock = threading.Lock()
+
+        # Pixel -> row/col lookup tables for cell_at (-1 outside the grid)
+        gx, gy = self._path_origin
+        self._px_to_col = [(x - gx) // self.cell if gx <= x < gx + grid_px else -1
+                           for x in range(self.screen.get_width())]
+        self._px_to_row = [(y - gy) // self.cell if gy <= y < gy + grid_px else -1
+                           for y in range(self.screen.get_height())]
         
         self.hint_segment: Optional[Tuple[Tuple[int,int], Tuple[int,int]]] = None
         self.hint_expire_at = 0
@@ -291,6 +312,50 @@ class Game:
                 'hovered': False
             }
 
+        # Button bar is pre-rendered into one surface; rebuilt only when hover changes
+        font_size = max(12, min(18, button_height // 3))
+        self._button_font = pygame.font.SysFont('Segoe UI', font_size, bold=True)
+        self._buttons_dirty = True
+        self._buttons_hovered: Optional[str] = None
+        self._buttons_surface: Optional[pygame.Surface] = None
+        self._buttons_origin = (0, 0)
+
+    def _render_button_bar(self):
+        """Render all game buttons (shadow, body, border, label) into one surface."""
+        rects = [data['rect'] for data in self.buttons.values()]
+        if not rects:
+            self._buttons_surface = None
+            self._buttons_dirty = False
+            return
+        # Shadow is offset by 3px, so grow the bar to include it
+        bar = rects[0].unionall(rects[1:])
+        bar.width += 3
+        bar.height += 3
+        surface = pygame.Surface(bar.size, pygame.SRCALPHA)
+        ox, oy = bar.topleft
+
+        for name, button_data in self.buttons.items():
+            rect = button_data['rect'].move(-ox, -oy)
+            base_color, hover_color = button_data['colors']
+            color = hover_color if name == self._buttons_hovered else base_color
+
+            # Shadow
+            pygame.draw.rect(surface, (0, 0, 0, 50), rect.move(3, 3), border_radius=8)
+
+            # Main button
+            pygame.draw.rect(surface, color, rect, border_radius=8)
+
+            # Subtle highlight border
+            highlight_color = tuple(min(255, c + 30) for c in color)
+            pygame.draw.rect(surface, highlight_color, rect, 2, border_radius=8)
+
+            text_surface = self._button_font.render(name, True, (255, 255, 255))
+            surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+        self._buttons_surface = surface.convert_alpha()
+        self._buttons_origin = (ox, oy)
+        self._buttons_dirty = False
+
     def _setup_victory_buttons(self):
         """Setup victory screen buttons - vertical layout with proper spacing for small windows"""
         # Leaderboard button
@@ -331,6 +396,46 @@ class Game:
                 'hovered': False
             }
 
+    def _build_background(self) -> pygame.Surface:
+        """Render the window background and empty grid cells once."""
+        n = self.board.n
+        bg = pygame.Surface(self.screen.get_size()).convert()
+        bg.fill(WHITE)
+        for r in range(n):
+            for c in range(n):
+                rect = pygame.Rect(*self.to_screen(r, c))
+                color = (245, 245, 245) if (r + c) % 2 == 0 else (250, 250, 250)
+                pygame.draw.rect(bg, color, rect)
+                pygame.draw.rect(bg, (220, 220, 220), rect, 1)
+        return bg
+
+    def _sync_path_surface(self):
+        """Bring the cached path layer up to date with self.path (hold _path_lock)."""
+        path = list(self.path)  # LLM thread may mutate self.path while we draw
+        drawn = self._path_drawn
+        if path == drawn:
+            return
+
+        k = self.board.k
+        line_width = int(self.cell * 0.6)
+        half = self.cell // 2
+        to_local = lambda rc: (rc[1] * self.cell + half, rc[0] * self.cell + half)
+
+        if len(path) == len(drawn) + 1 and path[:-1] == drawn:
+            # Extended by one cell: draw just the newest segment
+            if len(path) > 1:
+                draw_gradient_segment(self._path_surface, to_local(path[-2]), to_local(path[-1]),
+                                      line_width, self.line_color_start, self.line_color_end,
+                                      len(path) - 2, k)
+        else:
+            # Backtrack, reset or jump: re-rasterize the whole layer
+            self._path_surface.fill((0, 0, 0, 0))
+            if len(path) > 1:
+                draw_gradient_polyline(self._path_surface, [to_local(rc) for rc in path], line_width,
+                                       self.line_color_start, self.line_color_end,
+                                       0.0, (len(path) - 1) / max(1, k - 1))
+        self._path_drawn = path
+
     # ---------- helpers ----------
     def to_screen(self, r: int, c: int) -> Tuple[int,int,int,int]:
         # Calculate grid position (centered if window is larger than grid)
@@ -343,22 +448,13 @@ class Game:
 
     def cell_at(self, pos: Tuple[int,int]) -> Optional[Coord]:
         x, y = pos
-        y -= TOP_BAR
-        
-        # Calculate grid position (centered if window is larger than grid)
-        grid_width = self.board.n * self.cell + 2 * self.margin
-        grid_start_x = max(self.margin, (self.screen.get_width() - grid_width) // 2)
-        
-        # Adjust x coordinate for centered grid
-        x -= grid_start_x
-        y -= self.margin
-        
-        r = y // self.cell
-        c = x // self.cell
-        
-        if 0 <= r < self.board.n and 0 <= c < self.board.n:
-            return (r, c)
-        return None
+        if not (0 <= x < len(self._px_to_col) and 0 <= y < len(self._px_to_row)):
+            return None
+        r = self._px_to_row[y]
+        c = self._px_to_col[x]
+        if r < 0 or c < 0:
+            return None
+        return (r, c)
 
     def ensure_solution(self):
         if not self.solution:
@@ -371,7 +467,7 @@ class Game:
     def can_extend_to(self, cell: Coord) -> bool:
         if len(self.path) >= self.board.k or cell in self.path:
             return False
-        if self.path and cell not in self.board.neighbors(self.path[-1][0], self.path[-1][1], self.diag):
+        if self.path and not self.board.is_adjacent(self.path[-1], cell, self.diag):
             return False
         return True
 
@@ -491,41 +587,24 @@ class Game:
 
     # ---------- modern buttons ----------
     def draw_buttons(self):
-        """Draw modern styled buttons"""
+        """Draw modern styled buttons from the cached button bar surface"""
         mouse_pos = pygame.mouse.get_pos()
-        
+
+        hovered = None
         for name, button_data in self.buttons.items():
-            rect = button_data['rect']
-            base_color, hover_color = button_data['colors']
-            
-            # Check hover state
-            is_hovered = rect.collidepoint(mouse_pos)
+            is_hovered = button_data['rect'].collidepoint(mouse_pos)
             button_data['hovered'] = is_hovered
-            
-            # Choose color based on hover state
-            color = hover_color if is_hovered else base_color
-            
-            # Draw modern button with shadow effect
-            # Shadow
-            shadow_rect = pygame.Rect(rect.x + 3, rect.y + 3, rect.width, rect.height)
-            shadow_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surface, (0, 0, 0, 50), (0, 0, rect.width, rect.height), border_radius=8)
-            self.screen.blit(shadow_surface, (shadow_rect.x, shadow_rect.y))
-            
-            # Main button
-            pygame.draw.rect(self.screen, color, rect, border_radius=8)
-            
-            # Subtle highlight border
-            highlight_color = tuple(min(255, c + 30) for c in color)
-            pygame.draw.rect(self.screen, highlight_color, rect, 2, border_radius=8)
-            
-            # Button text with proper font sizing
-            font_size = max(12, min(18, rect.height // 3))
-            font = pygame.font.SysFont('Segoe UI', font_size, bold=True)
-            
-            text_surface = font.render(name, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
+            if is_hovered:
+                hovered = name
+
+        if hovered != self._buttons_hovered:
+            self._buttons_hovered = hovered
+            self._buttons_dirty = True
+        if self._buttons_dirty:
+            self._render_button_bar()
+
+        if self._buttons_surface is not None:
+            self.screen.blit(self._buttons_surface, self._buttons_origin)
 
     def draw_victory_buttons(self):
         """Draw victory screen buttons - vertical layout"""
@@ -594,10 +673,10 @@ class Game:
     
     def show_llm_provider_menu(self):
         """Show LLM provider selection."""
-        from config.llm_config import LLM_PROVIDERS
+        from config.llm_config import ENABLED_PROVIDERS
         import threading
         
-        providers = [(name, config) for name, config in LLM_PROVIDERS.items() if config.get("enabled")]
+        providers = ENABLED_PROVIDERS
         
         if not providers:
             self.status_msg = "No LLM providers available"
@@ -694,7 +773,12 @@ class Game:
         
         self.status_msg = f"Auto-solving with {provider}..."
         self.is_won = False
-        
+
+        # Clues never change during a run, so snapshot them once (flat, r*n+c)
+        n = self.board.n
+        grid_flat = [val for row in self.board.grid for val in row]
+        d2s = self.board.display_to_step or {}
+
         # Use configurable move cap for batch runs (falls back to k*2)
         max_iterations = getattr(self, "llm_max_moves", self.board.k * 2)
         iteration = 0
@@ -726,7 +810,7 @@ class Game:
                     llm_metrics_collector.record_move(
                         cell[0], cell[1], 
                         is_valid, 
-                        self.path.copy(),  # Current path for validation
+                        self.path,  # Current path for validation (read, not kept)
                         reason, 
                         confidence,
                         parsing_success,
@@ -735,11 +819,9 @@ class Game:
                     
                     # Update clue information if move was valid
                     if is_valid:
-                        display_val = self.board.grid[cell[0]][cell[1]]
+                        display_val = grid_flat[cell[0] * n + cell[1]]
                         is_on_clue = display_val > 0
-                        clue_number = None
-                        if is_on_clue and self.board.display_to_step:
-                            clue_number = self.board.display_to_step.get(display_val)
+                        clue_number = d2s.get(display_val) if is_on_clue else None
                         
                         # Update the last recorded move with clue info
                         if llm_metrics_collector.game_metrics and llm_metrics_collector.game_metrics.moves:
@@ -768,7 +850,7 @@ class Game:
                     
                     # Record failed parsing attempt
                     llm_metrics_collector.record_move(
-                        -1, -1, False, self.path.copy(), 
+                        -1, -1, False, self.path, 
                         "Parsing failed", 0.0, False, 
                         result.get("response_length", 0) if result else 0
                     )
@@ -784,7 +866,7 @@ class Game:
                 
                 # Record error as failed move
                 llm_metrics_collector.record_move(
-                    -1, -1, False, self.path.copy(),
+                    -1, -1, False, self.path,
                     f"Error: {str(e)[:50]}", 0.0, False, 0
                 )
         
@@ -1033,35 +1115,24 @@ class Game:
 
     def draw_grid(self):
         n = self.board.n
-        self.screen.fill(WHITE)
         
         # Calculate grid position (centered if window is larger than grid)
         grid_width = n * self.cell + 2 * self.margin
-        grid_height = n * self.cell + 2 * self.margin
         grid_start_x = max(self.margin, (self.screen.get_width() - grid_width) // 2)
         
-        # Draw grid background cells
-        for r in range(n):
-            for c in range(n):
-                x = grid_start_x + c * self.cell
-                y = TOP_BAR + self.margin + r * self.cell
-                rect = pygame.Rect(x, y, self.cell, self.cell)
-                color = (245, 245, 245) if (r + c) % 2 == 0 else (250, 250, 250)
-                if self.hover_cell == (r, c):
-                    color = (230, 240, 255)
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (220, 220, 220), rect, 1)
-
-        # Draw path with original line width but smooth
-        if len(self.path) > 1:
-            line_width = int(self.cell * 0.6)  # Keep original line width
-            centers = [
-                (grid_start_x + c*self.cell + self.cell//2,
-                 TOP_BAR + self.margin + r*self.cell + self.cell//2)
-                for (r, c) in self.path
-            ]
-            draw_gradient_polyline(self.screen, centers, line_width,
-                                   self.line_color_start, self.line_color_end)
+        # Cached background covers the whole window, so no separate clear is needed
+        self.screen.blit(self._bg_surface, (0, 0))
+        if self.hover_cell:
+            rect = pygame.Rect(*self.to_screen(*self.hover_cell))
+            pygame.draw.rect(self.screen, (230, 240, 255), rect)
+            pygame.draw.rect(self.screen, (220, 220, 220), rect, 1)
+
+        # Draw path from its cached layer (surface holds premultiplied color)
+        with self._path_lock:
+            self._sync_path_surface()
+            if len(self._path_drawn) > 1:
+                self.screen.blit(self._path_surface, self._path_origin,
+                                 special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # Draw hint arrow
         if self.hint_segment and pygame.time.get_ticks() < self.hint_expire_at:
@@ -1213,3 +1284,5 @@ class Game:
                 self.draw_grid()
                 
             pygame.display.flip()
+            if not self.gui_ready.is_set():
+                self.gui_ready.set()
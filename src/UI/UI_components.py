@@ -9,6 +9,67 @@ from typing import Tuple, List, Optional, Callable
 from enum import Enum
 
 
+# Nine-patch templates keyed by (radius, color): one (2R+1)^2 rounded rect serves every size
+_NINE_PATCH: dict = {}
+_TILE_SIZE = 64
+_TILES: dict = {}
+
+
+def _display_ready(surf: pygame.Surface) -> pygame.Surface:
+    return surf.convert_alpha() if pygame.display.get_surface() else surf
+
+
+def _nine_patch_template(radius: int, color: Tuple[int, ...]) -> pygame.Surface:
+    key = (radius, color)
+    tpl = _NINE_PATCH.get(key)
+    if tpl is None:
+        size = 2 * radius + 1
+        tpl = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(tpl, color, (0, 0, size, size), border_radius=radius)
+        tpl = _NINE_PATCH[key] = _display_ready(tpl)
+    return tpl
+
+
+def _blend_fill(surface: pygame.Surface, color: Tuple[int, ...], rect: Tuple[int, int, int, int]):
+    """Alpha-blend a solid color over rect by tiling one cached swatch"""
+    x, y, w, h = rect
+    if w <= 0 or h <= 0:
+        return
+    tile = _TILES.get(color)
+    if tile is None:
+        tile = pygame.Surface((_TILE_SIZE, _TILE_SIZE), pygame.SRCALPHA)
+        tile.fill(color)
+        tile = _TILES[color] = _display_ready(tile)
+    surface.blits([(tile, (tx, ty), (0, 0, min(_TILE_SIZE, x + w - tx), min(_TILE_SIZE, y + h - ty)))
+                   for ty in range(y, y + h, _TILE_SIZE)
+                   for tx in range(x, x + w, _TILE_SIZE)], doreturn=False)
+
+
+def draw_rounded_rect(surface: pygame.Surface, rect: pygame.Rect,
+                      color: Tuple[int, ...], border_radius: int):
+    """Draw a rounded rect (RGB or RGBA) from a nine-patch: four corner blits plus three bands"""
+    x, y, w, h = rect
+    if w <= 0 or h <= 0:
+        return
+    r = max(0, min(border_radius, w // 2, h // 2))
+    opaque = len(color) == 3 or color[3] == 255
+    if r:
+        tpl = _nine_patch_template(r, color)
+        surface.blit(tpl, (x, y), (0, 0, r, r))
+        surface.blit(tpl, (x + w - r, y), (r + 1, 0, r, r))
+        surface.blit(tpl, (x, y + h - r), (0, r + 1, r, r))
+        surface.blit(tpl, (x + w - r, y + h - r), (r + 1, r + 1, r, r))
+    bounds = surface.get_clip()
+    bands = ((x + r, y, w - 2 * r, r), (x + r, y + h - r, w - 2 * r, r), (x, y + r, w, h - 2 * r))
+    for band in bands:
+        band = bounds.clip(band)  # fill() doesn't shrink rects hanging off the top/left edge
+        if band.width > 0 and band.height > 0:
+            if opaque:
+                surface.fill(color, band)
+            else:
+                _blend_fill(surface, color, band)
+
+
 class ButtonState(Enum):
     NORMAL = "normal"
     HOVER = "hover"
@@ -16,6 +77,15 @@ class ButtonState(Enum):
     DISABLED = "disabled"
 
 
+# Hover animation target per state
+_HOVER_TARGET = {
+    ButtonState.NORMAL: 0.0,
+    ButtonState.HOVER: 1.0,
+    ButtonState.PRESSED: 1.0,
+    ButtonState.DISABLED: 0.0,
+}
+
+
 class ModernButton:
     """High-quality button with hover effects, shadows, and modern styling"""
     
@@ -40,6 +110,13 @@ class ModernButton:
         self.state = ButtonState.NORMAL
         self.hover_animation = 0.0
         self.press_animation = 0.0
+        # Label is static, so rasterize it once instead of every frame
+        self._text_surf = font.render(text, True, text_color)
+        if pygame.display.get_surface():
+            self._text_surf = self._text_surf.convert_alpha()
+        # Set by update() when the look changed enough to need a repaint
+        self._dirty = True
+        self._prev_key = None
         
     def update(self, mouse_pos: Tuple[int, int], mouse_pressed: bool, dt: float):
         """Update button state and animations"""
@@ -60,14 +137,28 @@ class ModernButton:
             self.state = ButtonState.NORMAL
             
         # Animate hover effect
-        target_hover = 1.0 if self.state in [ButtonState.HOVER, ButtonState.PRESSED] else 0.0
-        self.hover_animation += (target_hover - self.hover_animation) * dt * 8.0
-        self.hover_animation = max(0.0, min(1.0, self.hover_animation))
+        hover = self.hover_animation
+        hover += (_HOVER_TARGET[self.state] - hover) * dt * 8.0
+        if hover < 0.0:
+            hover = 0.0
+        elif hover > 1.0:
+            hover = 1.0
+        self.hover_animation = hover
         
         # Animate press effect
         if self.state != ButtonState.PRESSED:
             self.press_animation *= 1.0 - dt * 12.0
             self.press_animation = max(0.0, self.press_animation)
+        
+        # Only repaint when the quantized animation state moved
+        key = (int(self.hover_animation * 32), int(self.press_animation * 32), self.state)
+        self._dirty = key != self._prev_key
+        self._prev_key = key
+    
+    @property
+    def dirty(self) -> bool:
+        """True if the button changed since the last update and should be redrawn"""
+        return self._dirty
     
     def draw(self, surface: pygame.Surface):
         """Draw the button with all effects"""
@@ -97,28 +188,21 @@ class ModernButton:
         self._draw_rounded_rect(surface, draw_rect, current_bg, self.border_radius)
         
         # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=draw_rect.center)
-        surface.blit(text_surface, text_rect)
+        surface.blit(self._text_surf, self._text_surf.get_rect(center=draw_rect.center))
     
     def _lerp_color(self, color1: Tuple[int, int, int], color2: Tuple[int, int, int], t: float) -> Tuple[int, int, int]:
-        """Linear interpolation between two colors"""
+        """Linear interpolation between two colors (8.8 fixed point)"""
+        t_q8 = int(t * 256)
         return (
-            int(color1[0] + (color2[0] - color1[0]) * t),
-            int(color1[1] + (color2[1] - color1[1]) * t),
-            int(color1[2] + (color2[2] - color1[2]) * t)
+            color1[0] + ((color2[0] - color1[0]) * t_q8 >> 8),
+            color1[1] + ((color2[1] - color1[1]) * t_q8 >> 8),
+            color1[2] + ((color2[2] - color1[2]) * t_q8 >> 8)
         )
     
     def _draw_rounded_rect(self, surface: pygame.Surface, rect: pygame.Rect, 
                           color: Tuple[int, int, int], border_radius: int):
-        """Draw a rounded rectangle with anti-aliasing"""
-        if len(color) == 4:  # RGBA
-            # Create a temporary surface for alpha blending
-            temp_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(temp_surface, color, (0, 0, rect.width, rect.height), border_radius=border_radius)
-            surface.blit(temp_surface, rect.topleft)
-        else:  # RGB
-            pygame.draw.rect(surface, color, rect, border_radius=border_radius)
+        """Draw a rounded rectangle with alpha support"""
+        draw_rounded_rect(surface, rect, color, border_radius)
 
 
 class ModernCard:
@@ -152,12 +236,7 @@ class ModernCard:
     def _draw_rounded_rect(self, surface: pygame.Surface, rect: pygame.Rect, 
                           color: Tuple[int, int, int], border_radius: int):
         """Draw a rounded rectangle with alpha support"""
-        if len(color) == 4:  # RGBA
-            temp_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(temp_surface, color, (0, 0, rect.width, rect.height), border_radius=border_radius)
-            surface.blit(temp_surface, rect.topleft)
-        else:  # RGB
-            pygame.draw.rect(surface, color, rect, border_radius=border_radius)
+        draw_rounded_rect(surface, rect, color, border_radius)
 
 
 class GridLayout:
@@ -175,42 +254,64 @@ class GridLayout:
         
         self.cell_width = (width - padding * (cols + 1)) // cols
         self.cell_height = (height - padding * (rows + 1)) // rows
+        
+        # Column/row origins computed once; Rects are built lazily and reused
+        self._xs = [x + padding + c * (self.cell_width + padding) for c in range(cols)]
+        self._ys = [y + padding + r * (self.cell_height + padding) for r in range(rows)]
+        self._rects: List[Optional[pygame.Rect]] = [None] * (rows * cols)
+    
+    def get_cell_xywh(self, row: int, col: int) -> Tuple[int, int, int, int]:
+        """Get (x, y, w, h) for a specific grid cell without building a Rect"""
+        return (self._xs[col], self._ys[row], self.cell_width, self.cell_height)
     
     def get_cell_rect(self, row: int, col: int) -> pygame.Rect:
-        """Get the rectangle for a specific grid cell"""
-        x = self.x + self.padding + col * (self.cell_width + self.padding)
-        y = self.y + self.padding + row * (self.cell_height + self.padding)
-        return pygame.Rect(x, y, self.cell_width, self.cell_height)
+        """Get the rectangle for a specific grid cell (shared instance; copy before mutating)"""
+        i = row * self.cols + col
+        rect = self._rects[i]
+        if rect is None:
+            rect = self._rects[i] = pygame.Rect(self.get_cell_xywh(row, col))
+        return rect
 
 
 class AnimatedBackground:
     """Animated gradient background for modern look"""
     
+    COLOR1 = (245, 246, 248)  # Light gray
+    COLOR2 = (229, 231, 235)  # Slightly darker gray
+    WAVE = 0.1                # Gradient sway, as a fraction of the height
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
         self.time = 0.0
+        # Gradient strip padded by the wave amplitude on both ends; draw() scrolls through it
+        self._pad = int(self.height * self.WAVE)
+        self._strip = self._build_strip()
     
     def update(self, dt: float):
         """Update animation"""
         self.time += dt
     
+    def _build_strip(self) -> pygame.Surface:
+        """Render the static gradient once, spanning progress -WAVE..1+WAVE"""
+        c1, c2 = self.COLOR1, self.COLOR2
+        strip_h = self.height + 2 * self._pad
+        column = bytearray(strip_h * 3)
+        deltas = [b - a for a, b in zip(c1, c2)]
+        for y in range(strip_h):
+            t_q8 = ((y - self._pad) << 8) // self.height  # progress in 8.8 fixed point
+            i = y * 3
+            for ch in range(3):
+                column[i + ch] = max(0, min(255, c1[ch] + (deltas[ch] * t_q8 >> 8)))
+        strip = pygame.image.frombuffer(bytes(column), (1, strip_h), "RGB")
+        strip = pygame.transform.scale(strip, (self.width, strip_h))
+        return strip.convert() if pygame.display.get_surface() else strip
+    
     def draw(self, surface: pygame.Surface):
         """Draw animated background"""
-        # Create gradient from top to bottom
-        for y in range(self.height):
-            progress = y / self.height
-            wave = math.sin(self.time * 0.5 + progress * 2) * 0.1
-            
-            # Interpolate between two colors
-            color1 = (245, 246, 248)  # Light gray
-            color2 = (229, 231, 235)  # Slightly darker gray
-            
-            r = int(color1[0] + (color2[0] - color1[0]) * (progress + wave))
-            g = int(color1[1] + (color2[1] - color1[1]) * (progress + wave))
-            b = int(color1[2] + (color2[2] - color1[2]) * (progress + wave))
-            
-            pygame.draw.line(surface, (r, g, b), (0, y), (self.width, y))
+        # Sliding the window up shows a later part of the gradient, i.e. a positive wave
+        off = int(self._pad * (1 + math.sin(self.time * 0.5 + 1.0)))
+        surface.blit(self._strip, (0, 0), area=pygame.Rect(0, off, self.width, self.height))
 
 
 def draw_text_with_shadow(surface: pygame.Surface, text: str, font: pygame.font.Font,
@@ -231,11 +332,9 @@ def draw_text_with_shadow(surface: pygame.Surface, text: str, font: pygame.font.
 
 def create_fade_surface(width: int, height: int, start_alpha: int = 0, end_alpha: int = 255) -> pygame.Surface:
     """Create a surface with vertical alpha fade effect"""
-    surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    
-    for y in range(height):
-        alpha = start_alpha + int((end_alpha - start_alpha) * (y / height))
-        color = (0, 0, 0, alpha)
-        pygame.draw.line(surface, color, (0, y), (width, y))
-    
-    return surface
\ No newline at end of file
+    # Build a single RGBA column (black, alpha ramp) and stretch it to full width
+    column = bytearray(height * 4)
+    column[3::4] = bytes(start_alpha + int((end_alpha - start_alpha) * (y / height)) for y in range(height))
+    strip = pygame.image.frombuffer(bytes(column), (1, height), "RGBA")
+    surface = pygame.transform.scale(strip, (width, height))
+    return surface.convert_alpha() if pygame.display.get_surface() else surface
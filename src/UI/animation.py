@@ -7,22 +7,30 @@ class Animator:
         self.index = 1
         self.active = False
         self.next_tick = 0
+        self._buf = ()
+        self._n = 0
 
     def start(self):
         if not self.solution:
             return
+        # Snapshot the solution once; each tick just advances the index into it
+        self._buf = tuple(self.solution)
+        self._n = len(self._buf)
         self.active = True
         self.index = 1
         self.next_tick = pygame.time.get_ticks()
 
-    def update(self, now, path):
+    def update(self, now, path=None):
         if not self.active:
             return False
-        if now >= self.next_tick:
-            if self.index < len(self.solution):
-                path.append(self.solution[self.index])
-                self.index += 1
-                self.next_tick = now + self.delay_ms
-            else:
-                self.active = False
-        return self.active
+        if now < self.next_tick:
+            return True
+        i = self.index
+        if i < self._n:
+            if path is not None:
+                path.append(self._buf[i])
+            self.index = i + 1
+            self.next_tick = now + self.delay_ms
+            return True
+        self.active = False
+        return False
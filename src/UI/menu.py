@@ -7,7 +7,7 @@ import sys
 from typing import Optional, Tuple, List
 from enum import Enum
 from config.config import BOARD_SIZES
-from config.llm_config import LLM_PROVIDERS
+from config.llm_config import ENABLED_PROVIDERS, PROVIDER_MODEL
 
 # Import the new display function
 from leaderboard.leaderboard_display import show_enhanced_leaderboard
@@ -18,6 +18,13 @@ class MenuState(Enum):
     LLM_BOARD_SELECT = "llm_board_select"
     LLM_PROVIDER_SELECT = "llm_provider_select"
 
+MENU_TITLES = {
+    MenuState.MAIN_MENU: "ZIP Puzzle",
+    MenuState.HUMAN_BOARD_SELECT: "Select Size (Human)",
+    MenuState.LLM_BOARD_SELECT: "Select Size (LLM)",
+    MenuState.LLM_PROVIDER_SELECT: "Select Provider",
+}
+
 class ImprovedMenu:
     """Modern, high-quality menu system for ZIP Puzzle"""
     
@@ -42,13 +49,18 @@ class ImprovedMenu:
         self.selected_llm_provider: Optional[str] = None
         self.game_result: Optional[Tuple[int, str]] = None
         
-        # Mouse state
+        # Mouse state (clicks arrive as MOUSEBUTTONDOWN events)
         self.mouse_pos = (0, 0)
-        self.mouse_pressed = False
-        self.prev_mouse_pressed = False
-        self.click_consumed = False
         self.state_transition_time = 0
         self.transition_delay = 200
+        
+        # Static menu frames are only redrawn when something changed
+        self._needs_redraw = True
+        # Button rects for the one-call hover hit test; rebuilt after buttons change
+        self._button_rects: Optional[List[pygame.Rect]] = None
+        self._hovered_index = -1
+        # Rendered title (surface, rect) per menu state
+        self._title_cache = {}
 
     def setup_fonts(self):
         font_names = ['Segoe UI', 'Arial', 'Liberation Sans']
@@ -73,15 +85,19 @@ class ImprovedMenu:
     def is_click_allowed(self) -> bool:
         return (pygame.time.get_ticks() - self.state_transition_time) > self.transition_delay
     
-    def consume_click(self):
-        self.click_consumed = True
-    
-    def is_fresh_click(self) -> bool:
-        return (self.mouse_pressed and not self.prev_mouse_pressed and 
-                not self.click_consumed and self.is_click_allowed())
+    def handle_click(self, pos):
+        """Fire the callback of the button under pos, if any"""
+        if not self.is_click_allowed():
+            return
+        for b in self.buttons:
+            if b.rect.collidepoint(pos):
+                b.callback()
+                break
     
     def create_main_menu_buttons(self):
         self.buttons.clear()
+        self._needs_redraw = True
+        self._button_rects = None
         button_width, button_height, spacing = 320, 80, 20
         start_y = (self.screen_height - (4 * button_height + 3 * spacing)) // 2
         center_x = self.screen_width // 2 - button_width // 2
@@ -106,28 +122,51 @@ class ImprovedMenu:
 
     def create_simple_button(self, x, y, width, height, text, callback, color):
         class SimpleButton:
-            def __init__(self, x, y, width, height, text, callback, color):
+            def __init__(self, x, y, width, height, text, callback, color, font):
                 self.rect = pygame.Rect(x, y, width, height)
                 self.text = text
                 self.callback = callback
                 self.color = color
                 self.hover_color = tuple(min(255, c + 30) for c in color)
                 self.is_hovered = False
+                self._dirty = True
+                # Pre-rendered rounded backgrounds for the normal and hovered look
+                self._cached_bg = {hovered: self._render_bg(self.hover_color if hovered else color)
+                                   for hovered in (False, True)}
+                # Label never changes, so rasterize it once
+                self._text_font = font
+                self._cached_text = font.render(text, True, (255,255,255)).convert_alpha()
+                self._text_pos = self._cached_text.get_rect(center=self.rect.center)
+            
+            def _render_bg(self, c):
+                bg = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(bg, c, bg.get_rect(), border_radius=8)
+                return bg.convert_alpha()
             
             def update(self, mouse_pos):
-                self.is_hovered = self.rect.collidepoint(mouse_pos)
+                self.set_hovered(bool(self.rect.collidepoint(mouse_pos)))
+            
+            def set_hovered(self, hovered):
+                if hovered != self.is_hovered:
+                    self.is_hovered = hovered
+                    self._dirty = True
+            
+            def blit_items(self, font):
+                """(surface, dest) pairs for this button, ready for Surface.blits"""
+                if font is self._text_font:
+                    txt, pos = self._cached_text, self._text_pos
+                else:
+                    txt = font.render(self.text, True, (255,255,255))
+                    pos = txt.get_rect(center=self.rect.center)
+                return [(self._cached_bg[self.is_hovered], self.rect.topleft), (txt, pos)]
             
             def draw(self, surface, font):
-                c = self.hover_color if self.is_hovered else self.color
-                pygame.draw.rect(surface, c, self.rect, border_radius=8)
-                txt = font.render(self.text, True, (255,255,255))
-                surface.blit(txt, txt.get_rect(center=self.rect.center))
+                surface.blits(self.blit_items(font), doreturn=False)
         
-        return SimpleButton(x, y, width, height, text, callback, color)
+        return SimpleButton(x, y, width, height, text, callback, color, self.fonts['button'])
 
     def launch_leaderboard(self):
         """Switch to leaderboard display"""
-        self.consume_click()
         # This function handles its own loop
         show_enhanced_leaderboard(self.screen)
         # When it returns, we are back in main menu loop
@@ -136,6 +175,8 @@ class ImprovedMenu:
 
     def create_board_size_buttons(self):
         self.buttons.clear()
+        self._needs_redraw = True
+        self._button_rects = None
         cols, w, h, gap = 2, 200, 60, 20
         rows = (len(BOARD_SIZES) + 1) // 2
         grid_w = cols * w + (cols-1)*gap
@@ -159,7 +200,9 @@ class ImprovedMenu:
 
     def create_llm_provider_buttons(self):
         self.buttons.clear()
-        providers = [(n, c) for n, c in LLM_PROVIDERS.items() if c.get("enabled")]
+        self._needs_redraw = True
+        self._button_rects = None
+        providers = ENABLED_PROVIDERS
         if not providers: return
         
         cols, w, h, gap = 2, 280, 90, 20
@@ -173,7 +216,7 @@ class ImprovedMenu:
             y = start_y + r*(h+gap)
             
             dname = config.get('name', name)
-            model = config.get('model', '')[:22]
+            model = PROVIDER_MODEL[name][:22]
             text = f"{dname}" # Simple text for simple button
             
             color = ((168, 85, 247), (124, 58, 237))
@@ -187,7 +230,6 @@ class ImprovedMenu:
         ))
 
     def transition_to_state(self, new_state: MenuState):
-        self.consume_click()
         self.state_transition_time = pygame.time.get_ticks()
         self.current_state = new_state
         
@@ -201,7 +243,6 @@ class ImprovedMenu:
 
     def select_board_size(self, size: int):
         if not self.is_click_allowed(): return
-        self.consume_click()
         self.selected_board_size = size
         if self.current_state == MenuState.HUMAN_BOARD_SELECT:
             self.game_result = (size, "human")
@@ -210,7 +251,6 @@ class ImprovedMenu:
 
     def select_llm_provider(self, provider: str):
         if not self.is_click_allowed(): return
-        self.consume_click()
         self.game_result = (self.selected_board_size, provider)
 
     def quit_game(self):
@@ -221,16 +261,20 @@ class ImprovedMenu:
         self.screen.fill((245, 246, 248))
         
         # Title
-        ttext = "ZIP Puzzle"
-        if self.current_state == MenuState.HUMAN_BOARD_SELECT: ttext = "Select Size (Human)"
-        elif self.current_state == MenuState.LLM_BOARD_SELECT: ttext = "Select Size (LLM)"
-        elif self.current_state == MenuState.LLM_PROVIDER_SELECT: ttext = "Select Provider"
-        
-        title = self.fonts['title'].render(ttext, True, (17, 24, 39))
-        self.screen.blit(title, title.get_rect(center=(self.screen_width//2, 80)))
+        title = self._title_cache.get(self.current_state)
+        if title is None:
+            surf = self.fonts['title'].render(MENU_TITLES[self.current_state], True, (17, 24, 39)).convert_alpha()
+            title = self._title_cache[self.current_state] = (surf, surf.get_rect(center=(self.screen_width//2, 80)))
         
+        # Title and every button go to the screen in one batched blit call
+        seq = [title]
         for b in self.buttons:
-            b.draw(self.screen, self.fonts['button'])
+            seq.extend(b.blit_items(self.fonts['button']))
+        blit_batch = getattr(self.screen, 'fblits', None)
+        if blit_batch:
+            blit_batch(seq)
+        else:
+            self.screen.blits(seq, doreturn=False)
 
     def run(self) -> Tuple[Optional[int], Optional[str]]:
         if self.current_state == MenuState.MAIN_MENU:
@@ -242,32 +286,39 @@ class ImprovedMenu:
         elif self.current_state == MenuState.LLM_PROVIDER_SELECT:
             self.create_llm_provider_buttons()
         while True:
-            self.clock.tick(60)
+            self.clock.tick(30)  # nothing animates here; hover changes are all that redraw
             
-            self.prev_mouse_pressed = self.mouse_pressed
             self.mouse_pos = pygame.mouse.get_pos()
-            self.mouse_pressed = pygame.mouse.get_pressed()[0]
-            if not self.mouse_pressed: self.click_consumed = False
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT: self.quit_game()
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): self._needs_redraw = True
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    self.handle_click(event.pos)
+                    if self.game_result: break
             
-            # Button hover updates
-            for b in self.buttons: b.update(self.mouse_pos)
-            
-            # Clicks
-            if self.is_fresh_click():
-                for b in self.buttons:
-                    if b.rect.collidepoint(self.mouse_pos):
-                        b.callback()
-                        break
+            # Button hover updates: one collidelist call finds the hovered button
+            if self._button_rects is None:
+                self._button_rects = [b.rect for b in self.buttons]
+                self._hovered_index = -1
+                for b in self.buttons: b.set_hovered(False)
+            hit = pygame.Rect(self.mouse_pos, (1, 1)).collidelist(self._button_rects)
+            if hit != self._hovered_index:
+                if 0 <= self._hovered_index < len(self.buttons):
+                    self.buttons[self._hovered_index].set_hovered(False)
+                if hit >= 0:
+                    self.buttons[hit].set_hovered(True)
+                self._hovered_index = hit
             
             if self.game_result:
                 pygame.quit()
                 return self.game_result
             
-            self.draw()
-            pygame.display.flip()
+            if self._needs_redraw or any(b._dirty for b in self.buttons):
+                self.draw()
+                pygame.display.flip()
+                self._needs_redraw = False
+                for b in self.buttons: b._dirty = False
 
 def show_modern_menu() -> Tuple[Optional[int], Optional[str]]:
     menu = ImprovedMenu()
@@ -1,7 +1,9 @@
 import pygame
 import math
 import random
-from typing import Tuple, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Tuple, List
 
 # --- Gradient palettes (random per game) ---
 GRADIENT_SETS = [
@@ -28,42 +30,150 @@ def draw_cell_circle(screen, x, y, size, value=None, font=None, line_width_ratio
         screen.blit(txt, txt.get_rect(center=center))
 
 # --- Continuous HD gradient polyline (under circles) ---
+def _resample(points: List[Tuple[int,int]]) -> List[Tuple[int,int]]:
+    """Points spaced ~1px apart along the polyline."""
+    spoints: List[Tuple[int,int]] = []
+    append = spoints.append
+    x1, y1 = points[0]
+    for x2, y2 in points[1:]:
+        dx, dy = x2 - x1, y2 - y1
+        seg_len = max(1, int(math.hypot(dx, dy)))
+        for s in range(seg_len):
+            t = s / seg_len
+            append((int(x1 + t * dx), int(y1 + t * dy)))
+        x1, y1 = x2, y2
+    append((int(x1), int(y1)))
+    return spoints
+
+def _gradient_colors(count: int, color_start: Tuple[int,int,int], color_end: Tuple[int,int,int],
+                     t_start: float, t_end: float) -> List[Tuple[int,int,int,int]]:
+    """count RGBA colors spread evenly from t_start to t_end along the gradient."""
+    r0, g0, b0 = color_start
+    dr = color_end[0] - r0; dg = color_end[1] - g0; db = color_end[2] - b0
+    # Integer lerp with t in 16.16 fixed point; no float work per sample
+    t0 = int(t_start * 65536)
+    t_span = int(t_end * 65536) - t0
+    last = count - 1
+    colors = []
+    for i in range(count):
+        t = t0 + t_span * i // last
+        colors.append((r0 + (dr * t >> 16), g0 + (dg * t >> 16), b0 + (db * t >> 16), 255))
+    return colors
+
+# Anti-aliased disc coverage masks keyed by quantized radius
+_DISC_MASKS: Dict[float, Tuple[pygame.Surface, int]] = {}
+
+def _disc_mask(radius: float) -> Tuple[pygame.Surface, int]:
+    """White disc with analytic edge coverage in every channel, and its center offset."""
+    key = round(radius * 4) / 4
+    cached = _DISC_MASKS.get(key)
+    if cached is None:
+        c = int(math.ceil(key)) + 1
+        size = 2 * c + 1
+        buf = bytearray(size * size * 4)
+        for y in range(size):
+            for x in range(size):
+                cover = key + 0.5 - math.hypot(x - c, y - c)
+                if cover > 0:
+                    a = 255 if cover >= 1 else int(cover * 255)
+                    i = (y * size + x) * 4
+                    buf[i:i + 4] = bytes((a, a, a, a))
+        mask = pygame.image.frombuffer(bytes(buf), (size, size), "RGBA").copy()
+        cached = _DISC_MASKS[key] = (mask, c)
+    return cached
+
+def _paint_run(color_layer, coverage, color, run: List[Tuple[int,int]], radius: float):
+    """Paint same-colored samples: solid color (slightly dilated) plus AA coverage."""
+    mask, c = _disc_mask(radius)
+    size = 2 * c + 1
+    MAX = pygame.BLEND_RGBA_MAX
+    circle = pygame.draw.circle
+    if len(run) >= 3:
+        rx = {p[0] for p in run}; ry = {p[1] for p in run}
+        # A contiguous row/column span is two end discs plus a band; along the span
+        # each pixel's best coverage comes from the disc on its own column (or row)
+        if len(ry) == 1 and max(rx) - min(rx) + 1 == len(rx):
+            lo = min(rx); hi = max(rx); cy = run[0][1]
+            circle(color_layer, color, (lo, cy), c)
+            circle(color_layer, color, (hi, cy), c)
+            color_layer.fill(color, (lo, cy - c, hi - lo + 1, size))
+            band = pygame.transform.scale(mask.subsurface((c, 0, 1, size)), (hi - lo + 1, size))
+            coverage.blits([(mask, (lo - c, cy - c), None, MAX), (mask, (hi - c, cy - c), None, MAX),
+                            (band, (lo, cy - c), None, MAX)], doreturn=False)
+            return
+        if len(rx) == 1 and max(ry) - min(ry) + 1 == len(ry):
+            lo = min(ry); hi = max(ry); cx = run[0][0]
+            circle(color_layer, color, (cx, lo), c)
+            circle(color_layer, color, (cx, hi), c)
+            color_layer.fill(color, (cx - c, lo, size, hi - lo + 1))
+            band = pygame.transform.scale(mask.subsurface((0, c, size, 1)), (size, hi - lo + 1))
+            coverage.blits([(mask, (cx - c, lo - c), None, MAX), (mask, (cx - c, hi - c), None, MAX),
+                            (band, (cx - c, lo), None, MAX)], doreturn=False)
+            return
+    for p in run:
+        circle(color_layer, color, p, c)
+    coverage.blits([(mask, (sx - c, sy - c), None, MAX) for sx, sy in run], doreturn=False)
+
+def _axis_runs(run: List[Tuple[int,int]]) -> List[List[Tuple[int,int]]]:
+    """Split samples into consecutive pieces that each step <=1px along a single axis."""
+    pieces = [[run[0]]]
+    axis = None
+    for p in run[1:]:
+        piece = pieces[-1]
+        qx, qy = piece[-1]
+        if p[1] == qy and abs(p[0] - qx) <= 1 and axis != 'v':
+            axis = 'h'
+            piece.append(p)
+        elif p[0] == qx and abs(p[1] - qy) <= 1 and axis != 'h':
+            axis = 'v'
+            piece.append(p)
+        else:
+            axis = None
+            pieces.append([p])
+    return pieces
+
+def _is_axis_span(run: List[Tuple[int,int]]) -> bool:
+    rx = {p[0] for p in run}; ry = {p[1] for p in run}
+    return ((len(ry) == 1 and max(rx) - min(rx) + 1 == len(rx)) or
+            (len(rx) == 1 and max(ry) - min(ry) + 1 == len(ry)))
+
 def draw_gradient_polyline(surface, points: List[Tuple[int,int]], width: int,
                            color_start: Tuple[int,int,int],
-                           color_end: Tuple[int,int,int]):
+                           color_end: Tuple[int,int,int],
+                           t_start: float = 0.0, t_end: float = 1.0):
+    """Draw the polyline with its gradient running from t_start to t_end."""
     if len(points) < 2:
         return
-    SSAA = 2
-    swidth = int(width * SSAA)
+    radius = width * 0.45  # slightly tight for less bloom
+    pad = int(math.ceil(radius)) + 2
+    minx = min(p[0] for p in points) - pad; miny = min(p[1] for p in points) - pad
+    W = max(p[0] for p in points) + pad - minx + 1
+    H = max(p[1] for p in points) + pad - miny + 1
 
-    spoints: List[Tuple[int,int]] = []
-    for i in range(1, len(points)):
-        x1, y1 = points[i-1]; x2, y2 = points[i]
-        dx, dy = x2 - x1, y2 - y1
-        seg_len = max(1, int(math.hypot(dx, dy) * SSAA))
-        for s in range(seg_len):
-            t = s / seg_len
-            xi = int((x1 + t * dx) * SSAA)
-            yi = int((y1 + t * dy) * SSAA)
-            spoints.append((xi, yi))
-    x_end, y_end = points[-1]
-    spoints.append((int(x_end * SSAA), int(y_end * SSAA)))
+    spoints = _resample([(x - minx, y - miny) for x, y in points])
+    colors = _gradient_colors(len(spoints), color_start, color_end, t_start, t_end)
 
-    minx = min(p[0] for p in spoints); miny = min(p[1] for p in spoints)
-    maxx = max(p[0] for p in spoints); maxy = max(p[1] for p in spoints)
-    pad = swidth + 4
-    W = (maxx - minx) + 2*pad; H = (maxy - miny) + 2*pad
-    ssurf = pygame.Surface((max(W,1), max(H,1)), pygame.SRCALPHA)
+    # Rasterized at target resolution: later samples overwrite color on an opaque
+    # layer, while anti-aliased coverage accumulates (max) on a separate mask
+    color_layer = pygame.Surface((W, H), pygame.SRCALPHA)
+    coverage = pygame.Surface((W, H), pygame.SRCALPHA)
+    for color, group in groupby(zip(colors, spoints), key=itemgetter(0)):
+        run = [p for _, p in group]
+        if len(run) < 3 or _is_axis_span(run):
+            _paint_run(color_layer, coverage, color, run, radius)
+        else:
+            for piece in _axis_runs(run):
+                _paint_run(color_layer, coverage, color, piece, radius)
 
-    total_steps = len(spoints)
-    for i, (sx, sy) in enumerate(spoints):
-        t = i / (total_steps - 1)
-        r = int(color_start[0] + t * (color_end[0] - color_start[0]))
-        g = int(color_start[1] + t * (color_end[1] - color_start[1]))
-        b = int(color_start[2] + t * (color_end[2] - color_start[2]))
-        lx = sx - minx + pad; ly = sy - miny + pad
-        pygame.draw.circle(ssurf, (r, g, b, 255), (lx, ly), int(swidth * 0.45))  # slightly tight for less bloom
+    # color * coverage gives premultiplied pixels
+    color_layer.blit(coverage, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    surface.blit(color_layer, (minx, miny), special_flags=pygame.BLEND_PREMULTIPLIED)
 
-    smooth = pygame.transform.smoothscale(ssurf, (ssurf.get_width()//SSAA, ssurf.get_height()//SSAA))
-    dest_x = (minx - pad) / SSAA; dest_y = (miny - pad) / SSAA
-    surface.blit(smooth, (dest_x, dest_y), special_flags=pygame.BLEND_PREMULTIPLIED)
+def draw_gradient_segment(surface, p1: Tuple[int,int], p2: Tuple[int,int], width: int,
+                          color_start: Tuple[int,int,int],
+                          color_end: Tuple[int,int,int],
+                          i: int, k: int):
+    """Draw segment i -> i+1 of a k-point path, colored by its position in the full gradient."""
+    span = max(1, k - 1)
+    draw_gradient_polyline(surface, [p1, p2], width, color_start, color_end,
+                           i / span, (i + 1) / span)
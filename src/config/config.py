@@ -51,6 +51,9 @@ def get_clue_bounds(n: int):
 # multiple valid solutions on those sizes.
 FAST_MODE = True
 FAST_MODE_THRESHOLD = 10 # apply fast generation for n >= this
+# Race generation attempts across CPU cores; small boards are faster serially
+PARALLEL_GEN = True
+PARALLEL_GEN_THRESHOLD = 6 # apply parallel generation for n >= this
 
 
 # --- Timer ---
@@ -60,6 +63,8 @@ TIMER_WARNING_SECONDS = 60 # Show warning at this many seconds remaining
 
 # --- Leaderboard ---
 LEADERBOARD_FILE = "leaderboard.json"
+LEADERBOARD_LOG_FILE = "leaderboard.jsonl" # new scores are appended here between rewrites
+LEADERBOARD_COMPACT_EVERY = 20 # fold the log into LEADERBOARD_FILE after this many scores
 LEADERBOARD_MAX_ENTRIES = 10
 DIFFICULTY_MULTIPLIER = {
 3: 0.5, # 3x3 = easiest
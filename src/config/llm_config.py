@@ -29,15 +29,24 @@ LLM_PROVIDERS = {
     }
 }
 
+# Enabled providers and their models, resolved once at import
+ENABLED_PROVIDERS = tuple((n, c) for n, c in LLM_PROVIDERS.items() if c.get("enabled"))
+PROVIDER_MODEL = {n: c.get("model", "") for n, c in ENABLED_PROVIDERS}
+
 # --- Logging ---
 ENABLE_WANDB = True
 WANDB_PROJECT = "zip-puzzle-llm"
+WANDB_LOG_MOVES = False  # also log every move as a wandb.Table (one row per move)
 LOG_FILE = "llm_detailed_logs.txt"
 LOG_LEVEL = "INFO"
 
 # --- API Configuration ---
 MAX_LLM_RETRIES = 2
 LLM_TIMEOUT = 45
+LLM_MOVES_PER_CALL = 1  # headless runs: moves asked for per LLM call (1 = one move per prompt)
+LLM_MAX_MOVES_PER_CALL = 8  # longer look-ahead sequences lose too much accuracy
+LLM_PARALLEL_GAMES = 1  # headless batch runs: games played at once (mind provider rate limits)
+LLM_RESPONSE_CACHE_FILE = ".zip_llm_cache.json"  # replies reused by `zip_llm_tests.py --llm-cache`
 
 # --- Evaluation Settings ---
 ENABLE_THINKING_LOGS = True
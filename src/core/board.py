@@ -1,7 +1,36 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional, Set
 
 Coord = Tuple[int, int]
+Index = int  # flat cell index r*n + c, used by the generator/solver inner loops
+
+_DELTAS4 = ((-1,0),(1,0),(0,-1),(0,1))
+_DELTAS8 = _DELTAS4 + ((-1,-1),(-1,1),(1,-1),(1,1))
+
+def _neighbors_of(n: int, r: int, c: int, diag: bool) -> List[Coord]:
+    return [(r+dr, c+dc) for dr, dc in (_DELTAS8 if diag else _DELTAS4)
+            if 0 <= r+dr < n and 0 <= c+dc < n]
+
+@lru_cache(maxsize=None)
+def neighbor_table(n: int, diag: bool) -> List[List[Coord]]:
+    """In-bounds neighbors of every cell, indexed by r*n + c (shared; do not mutate)."""
+    return [_neighbors_of(n, i // n, i % n, diag) for i in range(n * n)]
+
+@lru_cache(maxsize=None)
+def index_neighbor_table(n: int, diag: bool) -> List[List[Index]]:
+    """neighbor_table with flat indices instead of coordinates (shared; do not mutate)."""
+    return [[r * n + c for r, c in nbrs] for nbrs in neighbor_table(n, diag)]
+
+@lru_cache(maxsize=None)
+def neighbor_mask_table(n: int, diag: bool) -> List[int]:
+    """Neighbors of every cell as a bitmask over flat indices (bit i = cell i)."""
+    return [sum(1 << i for i in nbrs) for nbrs in index_neighbor_table(n, diag)]
+
+@lru_cache(maxsize=None)
+def neighbor_set_table(n: int, diag: bool) -> List[frozenset]:
+    """Same as neighbor_table but as frozensets, for O(1) adjacency tests."""
+    return [frozenset(nbrs) for nbrs in neighbor_table(n, diag)]
 
 @dataclass
 class Board:
@@ -10,6 +39,19 @@ class Board:
     diag: bool = False             # True = 8-way moves; False = 4-way
     display_to_step: Optional[Dict[int, int]] = None  # maps display number → actual step
     step_to_display: Optional[Dict[int, int]] = None  # maps actual step → display number
+    _nei4: List[List[Coord]] = field(init=False, repr=False, compare=False)
+    _nei8: List[List[Coord]] = field(init=False, repr=False, compare=False)
+    _nei_set4: List[frozenset] = field(init=False, repr=False, compare=False)
+    _nei_set8: List[frozenset] = field(init=False, repr=False, compare=False)
+    _givens_cache: Optional[Dict[int, Coord]] = field(default=None, init=False, repr=False, compare=False)
+    _req_cache: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Adjacency depends only on n, so grid edits never invalidate it
+        self._nei4 = neighbor_table(self.n, False)
+        self._nei8 = neighbor_table(self.n, True)
+        self._nei_set4 = neighbor_set_table(self.n, False)
+        self._nei_set8 = neighbor_set_table(self.n, True)
 
     @property
     def n(self) -> int:
@@ -21,18 +63,43 @@ class Board:
     def neighbors(self, r: int, c: int, diag: Optional[bool] = None) -> List[Coord]:
         if diag is None:
             diag = self.diag
-        deltas = [(-1,0),(1,0),(0,-1),(0,1)]
-        if diag:
-            deltas += [(-1,-1),(-1,1),(1,-1),(1,1)]
-        out = []
-        for dr, dc in deltas:
-            nr, nc = r+dr, c+dc
-            if self.in_bounds(nr, nc):
-                out.append((nr, nc))
-        return out
+        n = self.n
+        if not (0 <= r < n and 0 <= c < n):
+            return _neighbors_of(n, r, c, diag)
+        return (self._nei8 if diag else self._nei4)[r * n + c]
+
+    def is_adjacent(self, a: Coord, b: Coord, diag: Optional[bool] = None) -> bool:
+        """O(1) check that b is a neighbor of a (a must be in bounds)."""
+        if diag is None:
+            diag = self.diag
+        return b in (self._nei_set8 if diag else self._nei_set4)[a[0] * self.n + a[1]]
+
+    def set_cell(self, r: int, c: int, value: int):
+        """Set a grid cell, invalidating the cached givens and updating required_steps."""
+        self.grid[r][c] = value
+        self._givens_cache = None
+        if self._req_cache is not None:
+            self._req_cache[r * self.n + c] = self._step_of(value)
+
+    def _step_of(self, display_val: int) -> int:
+        if not display_val:
+            return 0
+        if self.display_to_step:
+            # Convert display value to actual step
+            return self.display_to_step.get(display_val) or 0
+        # Fallback: assume display == step (backward compat)
+        return display_val
+
+    def required_steps(self) -> List[int]:
+        """Step each cell (flat index r*n + c) must be visited at, 0 = unconstrained (cached)."""
+        if self._req_cache is None:
+            self._req_cache = [self._step_of(v) for row in self.grid for v in row]
+        return self._req_cache
 
     def givens(self) -> Dict[int, Coord]:
-        """Returns mapping of actual step → coordinate."""
+        """Returns mapping of actual step → coordinate (cached; edit the grid via set_cell)."""
+        if self._givens_cache is not None:
+            return self._givens_cache
         m: Dict[int, Coord] = {}
         for r in range(self.n):
             for c in range(self.n):
@@ -46,6 +113,7 @@ class Board:
                     else:
                         # Fallback: assume display == step (backward compat)
                         m[display_val] = (r, c)
+        self._givens_cache = m
         return m
 
 
@@ -63,20 +131,25 @@ def validate_path(board: Board, path: List[Coord], diag: Optional[bool] = None)
     if len(path) != board.k:
         return False, f"Expected {board.k} steps, got {len(path)}"
     
+    n = board.n
+    grid = board.grid
+    nei = board._nei_set8 if diag else board._nei_set4
     seen: Set[Coord] = set()
     clue_positions = {}  # Map display_num → position in path where user placed it
     
+    # Shape errors (repeat, bounds, adjacency) are reported before any clue error
     for i, cell in enumerate(path):
         if cell in seen:
             return False, f"Cell {cell} repeated"
-        if not board.in_bounds(*cell):
+        r, c = cell
+        if not (0 <= r < n and 0 <= c < n):
             return False, f"Cell {cell} out of bounds"
-        if i > 0 and cell not in board.neighbors(*path[i-1], diag):
+        if i > 0 and cell not in nei[path[i-1][0] * n + path[i-1][1]]:
             return False, f"Step {i}->{i+1} not adjacent"
         seen.add(cell)
         
         # Record clue positions
-        display_val = board.grid[cell[0]][cell[1]]
+        display_val = grid[r][c]
         if display_val:
             clue_positions[display_val] = i + 1
     
@@ -89,12 +162,12 @@ def validate_path(board: Board, path: List[Coord], diag: Optional[bool] = None)
         return False, "Clue 1 must be at the start"
     
     # Get all clues in order
-    sorted_clues = sorted(clue_positions.keys())
+    sorted_clues = sorted(clue_positions)
     
     # Verify clues are in ascending order by position
     for j in range(1, len(sorted_clues)):
         if clue_positions[sorted_clues[j]] <= clue_positions[sorted_clues[j-1]]:
-            return False, f"Clues out of order"
+            return False, "Clues out of order"
     
     # Check that clues are CONSECUTIVE (1, 2, 3, ... without gaps)
     for i, clue in enumerate(sorted_clues):
@@ -103,8 +176,7 @@ def validate_path(board: Board, path: List[Coord], diag: Optional[bool] = None)
     
     # Must END at the highest clue number (no cells after highest clue)
     highest_clue = sorted_clues[-1]
-    highest_clue_pos = clue_positions[highest_clue]
-    if highest_clue_pos != len(path):
+    if clue_positions[highest_clue] != len(path):
         return False, f"Path must end at clue {highest_clue}, not continue beyond it"
     
-    return True, "OK"
\ No newline at end of file
+    return True, "OK"
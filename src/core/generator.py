@@ -1,51 +1,119 @@
+import os
 import random
+import threading
+import multiprocessing
+import atexit
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Tuple, Dict, Set, Optional
-from core.board import Board, Coord
+from core.board import Board, Coord, Index, index_neighbor_table, neighbor_mask_table
 from core.solver import count_solutions
 import config.config as config
 
+_scratch = threading.local()
+
+# One process pool for the whole session, built on first use. Spawned rather
+# than forked: callers (GUI LLM thread, batch runner) already have threads.
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_race_lock = threading.Lock()  # one race at a time on the shared pool
+# Race counter shared with the workers; bumping it tells running attempts of
+# the finished race to give up (set in workers by _init_worker)
+_round = None
+
+
+def _init_worker(round_value):
+    global _round
+    _round = round_value
+
+
+def _walk_buffers(k: int) -> Tuple[List[Index], List[int]]:
+    """This thread's (path, pos) scratch for _random_saw_cover_all, reset for reuse.
+
+    Only the cells the previous walk touched are reset, so restarts allocate nothing.
+    """
+    bufs = getattr(_scratch, "walk", None)
+    if bufs is None or len(bufs[1]) != k:
+        bufs = _scratch.walk = ([], [-1] * k)
+        return bufs
+    path, pos = bufs
+    for cell in path:
+        pos[cell] = -1
+    path.clear()
+    return bufs
+
 
 def _random_saw_cover_all(n: int, diag: bool) -> Optional[List[Coord]]:
-    """Generate a full Hamiltonian path (self-avoiding walk) covering all cells."""
+    """Generate a full Hamiltonian path (self-avoiding walk) covering all cells.
+
+    Greedy Warnsdorff extension; when the end is stuck, a Pósa rotation moves
+    the end instead of backtracking. Gives up (None) after 3*k rotations.
+    Works on flat cell indices and converts to coordinates once at the end.
+    """
     k = n * n
-    cells = [(r, c) for r in range(n) for c in range(n)]
-    start = random.choice(cells)
-    path, used = [start], {start}
-
-    def onward_degree(cell: Coord) -> int:
-        r, c = cell
-        moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        if diag:
-            moves += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        deg = 0
-        for dr, dc in moves:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < n and 0 <= nc < n and (nr, nc) not in used:
-                deg += 1
-        return deg
-
-    def neighbors(r: int, c: int):
-        moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        if diag:
-            moves += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        res = [(r + dr, c + dc) for dr, dc in moves if 0 <= r + dr < n and 0 <= c + dc < n and (r + dr, c + dc) not in used]
-        random.shuffle(res)
-        res.sort(key=onward_degree)
-        return res
-
-    def dfs() -> bool:
-        if len(path) == k:
-            return True
-        for nb in neighbors(*path[-1]):
-            used.add(nb)
+    path, pos = _walk_buffers(k)  # pos: cell → index in path, -1 while unvisited
+    start = random.randrange(k)
+    path.append(start)
+    pos[start] = 0
+    adj = index_neighbor_table(n, diag)
+    nbmask = neighbor_mask_table(n, diag)
+    unvisited = ((1 << k) - 1) & ~(1 << start)  # rotations keep the visited set as is
+
+    def onward_degree(cell: Index) -> int:
+        return (nbmask[cell] & unvisited).bit_count()
+
+    rotations = 0
+    while len(path) < k:
+        nbs = adj[path[-1]]
+        free = [nb for nb in nbs if pos[nb] < 0]
+        if free:
+            random.shuffle(free)
+            nb = min(free, key=onward_degree)
+            pos[nb] = len(path)
             path.append(nb)
-            if dfs():
-                return True
-            path.pop()
-            used.remove(nb)
-        return False
+            unvisited ^= 1 << nb
+            continue
 
-    return path if dfs() else None
+        if rotations >= 3 * k:
+            return None
+        rotations += 1
+        # Rotate at an on-path neighbor v = path[j]: reversing path[j+1:] makes
+        # path[j+1] the new end while keeping every cell on the path
+        last = len(path) - 1
+        pivots = [pos[nb] for nb in nbs if pos[nb] < last - 1]
+        if not pivots:
+            return None
+        j = random.choice(pivots)
+        path[j + 1:] = path[:j:-1]
+        for idx in range(j + 1, len(path)):
+            pos[path[idx]] = idx
+    return [divmod(i, n) for i in path]
+
+
+def _has_segment_reversal(n: int, diag: bool, cells: List[Index], clue_set: Set[int]) -> bool:
+    """True if the clues certainly admit a second solution besides the path itself.
+
+    When cells[i]~cells[j] and cells[i+1]~cells[j+1], walking cells[i+1..j]
+    backwards gives another full path; if none of those cells is a clue, the
+    clue set cannot tell the two apart. O(k * degree), so it is run before
+    the much more expensive count_solutions.
+    """
+    k = len(cells)
+    adj = index_neighbor_table(n, diag)
+    pos = [0] * k
+    for i, cell in enumerate(cells):
+        pos[cell] = i
+    # before[i] = clues among path positions 0..i-1 (position i is step i+1)
+    before = [0] * (k + 1)
+    for i in range(k):
+        before[i + 1] = before[i] + ((i + 1) in clue_set)
+    for i in range(k - 3):
+        nxt = adj[cells[i + 1]]
+        for q in adj[cells[i]]:
+            j = pos[q]
+            if i + 1 < j < k - 1 and cells[j + 1] in nxt and before[j + 1] == before[i + 1]:
+                return True
+    return False
 
 
 def _grid_with_clues_from_path(n: int, path: List[Coord], clue_indices: Set[int]) -> List[List[int]]:
@@ -90,35 +158,132 @@ def _generate_puzzle_fast(n: int, diag: bool):
     raise RuntimeError("Fast generator failed to build Hamiltonian path.")
 
 
+def _attempt_once(n: int, diag: bool, clue_start: int, seed: Optional[int] = None,
+                  round_id: Optional[int] = None):
+    """One generation attempt: a fresh path, then clues until unique. None on failure.
+
+    With round_id (pool workers), the attempt also gives up once that race is over.
+    """
+    stale = lambda: round_id is not None and _round is not None and _round.value != round_id
+    if seed is not None:
+        random.seed(seed)
+    path = _random_saw_cover_all(n, diag)
+    if not path or stale():
+        return None
+    k = n * n
+    start_clues, max_clues = config.get_clue_bounds(n)
+
+    clue_set = {1, k}
+    extras = list(range(2, k))
+    random.shuffle(extras)
+    for idx in extras[:clue_start - 2]:
+        clue_set.add(idx)
+
+    more = [i for i in range(2, k) if i not in clue_set]
+    random.shuffle(more)
+    cells = [r * n + c for r, c in path]
+    # One board for the whole attempt; each added clue is a single cell edit
+    board = Board(grid=_grid_with_clues_from_path(n, path, clue_set), k=k, diag=diag)
+    while True:
+        if stale():
+            return None
+        # Only pay for the solver when no reversible stretch already proves ambiguity
+        if _has_segment_reversal(n, diag, cells, clue_set):
+            count = 2
+        else:
+            count = count_solutions(board, diag=diag, limit=2, time_limit=config.SOLVER_TIME_LIMIT)
+        if count == 1:
+            display_grid, mapping = _create_display_grid(board.grid, clue_set)
+            return display_grid, path, mapping
+        if len(clue_set) >= max_clues or not more:
+            return None
+        step = more.pop()
+        clue_set.add(step)
+        r, c = path[step - 1]
+        board.set_cell(r, c, step)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _round
+    with _pool_lock:
+        if _pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            _round = ctx.Value('L', 0)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                        initializer=_init_worker, initargs=(_round,))
+        return _pool
+
+
+def _end_round():
+    """Abort whatever attempts of the current race are still running."""
+    if _round is not None:
+        with _round.get_lock():
+            _round.value += 1
+
+
+def _discard_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+        _end_round()
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_discard_pool)
+
+
+def _generate_parallel(n: int, diag: bool, workers: int, attempts: int):
+    """Race attempts across processes; the first unique puzzle wins.
+
+    Returns (result or None, attempts used).
+    """
+    pool = _get_pool(workers)
+    with _race_lock:
+        # Workers are spawned, so pass runtime config explicitly
+        args = (n, diag, config.CLUE_START)
+        round_id = _round.value
+        used = 0
+        try:
+            while used < attempts:
+                batch = min(workers, attempts - used)
+                used += batch
+                futures = [pool.submit(_attempt_once, *args, random.getrandbits(32), round_id)
+                           for _ in range(batch)]
+                try:
+                    for fut in as_completed(futures):
+                        result = fut.result()
+                        if result is not None:
+                            return result, used
+                finally:
+                    # Drop this batch's queued attempts
+                    for fut in futures:
+                        fut.cancel()
+            return None, used
+        finally:
+            # ...and stop the running losers at their next solver call
+            _end_round()
+
+
 def generate_unique_puzzle(n: int, diag: bool):
     if config.FAST_MODE and n >= config.FAST_MODE_THRESHOLD:
         return _generate_puzzle_fast(n, diag)
 
-    attempts = 0
-    while attempts < config.MAX_GEN_ATTEMPTS:
-        attempts += 1
-        path = _random_saw_cover_all(n, diag)
-        if not path:
-            continue
-        k = n * n
-        start_clues, max_clues = config.get_clue_bounds(n)
-
-        clue_set = {1, k}
-        extras = list(range(2, k))
-        random.shuffle(extras)
-        for idx in extras[:config.CLUE_START - 2]:
-            clue_set.add(idx)
+    attempts = config.MAX_GEN_ATTEMPTS
+    workers = min(os.cpu_count() or 1, attempts)
+    if config.PARALLEL_GEN and n >= config.PARALLEL_GEN_THRESHOLD and workers > 1:
+        try:
+            result, used = _generate_parallel(n, diag, workers, attempts)
+            if result is not None:
+                return result
+            attempts -= used
+        except (OSError, BrokenProcessPool) as e:
+            _discard_pool()
+            print(f"[Generator] Parallel generation unavailable ({e}), falling back to serial")
 
-        more = [i for i in range(2, k) if i not in clue_set]
-        random.shuffle(more)
-        while True:
-            grid = _grid_with_clues_from_path(n, path, clue_set)
-            board = Board(grid=grid, k=k, diag=diag)
-            count = count_solutions(board, diag=diag, limit=2, time_limit=config.SOLVER_TIME_LIMIT)
-            if count == 1:
-                display_grid, mapping = _create_display_grid(grid, clue_set)
-                return display_grid, path, mapping
-            if len(clue_set) >= max_clues or not more:
-                break
-            clue_set.add(more.pop())
+    # Serial gets whatever budget the parallel race didn't spend
+    for _ in range(attempts):
+        result = _attempt_once(n, diag, config.CLUE_START)
+        if result is not None:
+            return result
     raise RuntimeError("Failed to generate unique puzzle. Try smaller n or longer limits.")
@@ -1,121 +1,209 @@
 import os
 import time
-from typing import List, Optional, Tuple, Set
-from core.board import Board, Coord
+from typing import Iterator, List, Optional
+from core.board import Board, Coord, index_neighbor_table
 
 # ---------------- classical solver ----------------
+# Cells are flat indices (r*n + c) and the visited set is an int bitmask
 
-def _ordered_neighbors(board: Board, cell: Coord, used: Set[Coord], diag: bool) -> List[Coord]:
-    # Warnsdorff-like heuristic: try cells with the fewest onward options first
-    opts = [nb for nb in board.neighbors(cell[0], cell[1], diag) if nb not in used]
-    opts.sort(key=lambda nb: sum(1 for x in board.neighbors(nb[0], nb[1], diag) if x not in used))
-    return opts
+PRUNE_MIN_N = 7       # connectivity pruning only pays off on larger boards
+PRUNE_INTERVAL = 4    # ...and only every few levels
 
-def solve_backtracking(board: Board, diag: bool, time_limit: float = 8.0) -> Optional[List[Coord]]:
-    """Find a 1..k path consistent with givens."""
-    start_time = time.time()
-    giv = board.givens()  # Maps actual step → coordinate
+def _prepare(board: Board, diag: bool):
+    n = board.n
     k = board.k
+    # actual step → cell, -1 where the step has no given (sized so step k+1 is a valid lookup)
+    step_to_idx = [-1] * (k + 2)
+    for step, (r, c) in board.givens().items():
+        if 0 < step <= k:
+            step_to_idx[step] = r * n + c
+    starts = [step_to_idx[1]] if step_to_idx[1] >= 0 else list(range(n * n))
+    return index_neighbor_table(n, diag), board.required_steps(), step_to_idx, starts
+
+def _ordered_neighbors(nei: List[List[int]], last: int, mask: int, degree: List[int]) -> List[int]:
+    # Warnsdorff-like heuristic: try cells with the fewest onward options first
+    opts = [nb for nb in nei[last] if not (mask >> nb) & 1]
+    opts.sort(key=degree.__getitem__)
+    return opts
 
-    # starting candidates
-    starts = [giv[1]] if 1 in giv else [(r, c) for r in range(board.n) for c in range(board.n)]
-
-    used: Set[Coord] = set()
-    path: List[Coord] = []
-
-    def dfs(step: int) -> bool:
-        if time.time() - start_time > time_limit:
-            return False
-        if step > k:
-            return True
-        target = giv.get(step)  # Get target for actual step
-        last = path[-1]
-        cands: List[Coord]
-        if target:
-            # must step to that target if it's adjacent and free
-            cands = [target] if target not in used and target in board.neighbors(last[0], last[1], diag) else []
-        else:
-            cands = _ordered_neighbors(board, last, used, diag)
-
-        for cell in cands:
-            if cell in used:
-                continue
-            display_val = board.grid[cell[0]][cell[1]]
-            # Convert display value to actual step and check
-            if display_val:
-                if board.display_to_step:
-                    actual_step = board.display_to_step.get(display_val)
-                    if actual_step and actual_step != step:
-                        continue
-                else:
-                    # Fallback: direct comparison
-                    if display_val != step:
-                        continue
-            used.add(cell); path.append(cell)
-            if dfs(step + 1):
-                return True
-            path.pop(); used.remove(cell)
-        return False
+def _visit(nei: List[List[int]], degree: List[int], cell: int, delta: int):
+    """Adjust the free-neighbor count of cell's neighbors as it is taken (-1) or released (+1)."""
+    for x in nei[cell]:
+        degree[x] += delta
+
+def _free_connected(nei: List[List[int]], mask: int, last: int, free: int) -> bool:
+    """True if every free cell is reachable from last through free cells."""
+    seen = 0
+    stack = [last]
+    while stack:
+        for x in nei[stack.pop()]:
+            bit = 1 << x
+            if not (mask | seen) & bit:
+                seen |= bit
+                stack.append(x)
+    return seen == free
+
+def _candidates(nei: List[List[int]], step_to_idx: List[int], degree: List[int],
+                step: int, last: int, mask: int) -> List[int]:
+    target = step_to_idx[step]
+    if target >= 0:
+        # must step to that target if it's adjacent and free
+        return [target] if not (mask >> target) & 1 and target in nei[last] else []
+    return _ordered_neighbors(nei, last, mask, degree)
+
+# The DFS kernels below only see flat int tables, never the Board. They run on an
+# explicit stack of candidate iterators (one per placed cell) rather than recursion,
+# and only read the (monotonic) clock every CLOCK_INTERVAL nodes.
+#
+# Everything below a node depends only on (last cell, visited mask) - the step is
+# the mask's popcount - so finished subtrees are memoised on that pair. The memo
+# is bounded and simply starts over when full.
+
+CLOCK_INTERVAL = 0x400
+MEMO_LIMIT = 1 << 16
+
+def _remember(memo: dict, key, value):
+    if len(memo) >= MEMO_LIMIT:
+        memo.clear()
+    memo[key] = value
+
+def _dfs_solve(nei: List[List[int]], req: List[int], step_to_idx: List[int], k: int,
+               starts: List[int], deadline: float, prune: int = 0) -> Optional[List[int]]:
+    clock = time.monotonic
+    full = (1 << len(nei)) - 1
+    budget = CLOCK_INTERVAL
+    dead: dict = {}  # (last, mask) states with no completion
 
     for s in starts:
-        used.clear(); path.clear()
-        used.add(s); path.append(s)
-        if dfs(2):
-            return path
+        if k < 2:
+            return [s]
+        # degree[i] = free neighbors of cell i, kept in step with the mask
+        degree = [len(cells) for cells in nei]
+        _visit(nei, degree, s, -1)
+        path = [s]
+        mask = 1 << s
+        step = 2  # step the top iterator is choosing a cell for
+        stack: List[Iterator[int]] = [iter(_candidates(nei, step_to_idx, degree, step, s, mask))]
+        while stack:
+            budget -= 1
+            if not budget:
+                if clock() > deadline:
+                    return None
+                budget = CLOCK_INTERVAL
+            cell = next(stack[-1], None)
+            if cell is None:
+                # level exhausted: take back the cell that led here
+                stack.pop()
+                step -= 1
+                if stack:
+                    _remember(dead, (path[-1], mask), True)
+                    cell = path.pop()
+                    mask ^= 1 << cell
+                    _visit(nei, degree, cell, 1)
+                continue
+            need = req[cell]
+            if need and need != step:
+                continue
+            mask |= 1 << cell
+            if step < k and (cell, mask) in dead:
+                mask ^= 1 << cell
+                continue
+            path.append(cell)
+            _visit(nei, degree, cell, -1)
+            if step == k:
+                return path
+            step += 1
+            # A full cover is impossible once the free cells split apart
+            if prune and step % prune == 0 and not _free_connected(nei, mask, cell, full & ~mask):
+                stack.append(iter(()))
+            else:
+                stack.append(iter(_candidates(nei, step_to_idx, degree, step, cell, mask)))
     return None
 
-def count_solutions(board: Board, diag: bool, limit: int = 2, time_limit: float = 8.0) -> int:
-    """Count up to 'limit' solutions (early stop)."""
-    start_time = time.time()
-    giv = board.givens()  # Maps actual step → coordinate
-    k = board.k
-
-    starts = [giv[1]] if 1 in giv else [(r, c) for r in range(board.n) for c in range(board.n)]
-
-    used: Set[Coord] = set()
-    path: List[Coord] = []
+def _dfs_count(nei: List[List[int]], req: List[int], step_to_idx: List[int], k: int,
+               starts: List[int], limit: int, deadline: float, prune: int = 0) -> int:
+    clock = time.monotonic
+    full = (1 << len(nei)) - 1
+    budget = CLOCK_INTERVAL
     count = 0
+    completions: dict = {}  # (last, mask) → solutions below that state
 
-    def dfs(step: int) -> bool:
-        nonlocal count
-        if time.time() - start_time > time_limit:
-            return True
-        if step > k:
+    for s in starts:
+        if k < 2:
             count += 1
-            return count >= limit
-        last = path[-1]
-        target = giv.get(step)  # Get target for actual step
-        if target:
-            candidates = [target] if target not in used and target in board.neighbors(last[0], last[1], diag) else []
-        else:
-            candidates = _ordered_neighbors(board, last, used, diag)
-        for cell in candidates:
-            if cell in used:
+            if count >= limit:
+                break
+            continue
+        degree = [len(cells) for cells in nei]
+        _visit(nei, degree, s, -1)
+        path = [s]
+        mask = 1 << s
+        step = 2
+        stack: List[Iterator[int]] = [iter(_candidates(nei, step_to_idx, degree, step, s, mask))]
+        entered = [0]  # count when each stack level was pushed
+        while stack:
+            budget -= 1
+            if not budget:
+                if clock() > deadline:
+                    return count
+                budget = CLOCK_INTERVAL
+            cell = next(stack[-1], None)
+            if cell is None:
+                stack.pop()
+                before = entered.pop()
+                step -= 1
+                if stack:
+                    _remember(completions, (path[-1], mask), count - before)
+                    cell = path.pop()
+                    mask ^= 1 << cell
+                    _visit(nei, degree, cell, 1)
                 continue
-            display_val = board.grid[cell[0]][cell[1]]
-            # Convert display value to actual step and check
-            if display_val:
-                if board.display_to_step:
-                    actual_step = board.display_to_step.get(display_val)
-                    if actual_step and actual_step != step:
-                        continue
-                else:
-                    # Fallback: direct comparison
-                    if display_val != step:
-                        continue
-            used.add(cell); path.append(cell)
-            if dfs(step + 1):
-                return True
-            path.pop(); used.remove(cell)
-        return False
-
-    for s in starts:
-        used.clear(); path.clear()
-        used.add(s); path.append(s)
-        if dfs(2) or count >= limit:
-            break
+            need = req[cell]
+            if need and need != step:
+                continue
+            if step == k:
+                count += 1
+                if count >= limit:
+                    return count
+                continue
+            mask |= 1 << cell
+            known = completions.get((cell, mask))
+            if known is not None:
+                mask ^= 1 << cell
+                count += known
+                if count >= limit:
+                    return limit
+                continue
+            path.append(cell)
+            _visit(nei, degree, cell, -1)
+            step += 1
+            if prune and step % prune == 0 and not _free_connected(nei, mask, cell, full & ~mask):
+                stack.append(iter(()))
+            else:
+                stack.append(iter(_candidates(nei, step_to_idx, degree, step, cell, mask)))
+            entered.append(count)
     return count
 
+def _prune_interval(board: Board) -> int:
+    # Only sound when the path has to cover every cell
+    return PRUNE_INTERVAL if board.n >= PRUNE_MIN_N and board.k == board.n * board.n else 0
+
+def solve_backtracking(board: Board, diag: bool, time_limit: float = 8.0) -> Optional[List[Coord]]:
+    """Find a 1..k path consistent with givens."""
+    deadline = time.monotonic() + time_limit
+    nei, req, step_to_idx, starts = _prepare(board, diag)
+    path = _dfs_solve(nei, req, step_to_idx, board.k, starts, deadline, _prune_interval(board))
+    if path is None:
+        return None
+    n = board.n
+    return [divmod(i, n) for i in path]
+
+def count_solutions(board: Board, diag: bool, limit: int = 2, time_limit: float = 8.0) -> int:
+    """Count up to 'limit' solutions (early stop)."""
+    deadline = time.monotonic() + time_limit
+    nei, req, step_to_idx, starts = _prepare(board, diag)
+    return _dfs_count(nei, req, step_to_idx, board.k, starts, limit, deadline, _prune_interval(board))
+
 
 # ---------------- optional LLM helper ----------------
 class LLMSolver:
@@ -1,7 +1,9 @@
 import time
 import logging
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from config.llm_config import ENABLE_WANDB, WANDB_PROJECT, WANDB_LOG_MOVES
 
 try:
     import wandb
@@ -11,7 +13,7 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class MoveMetrics:
     """Track metrics for a single LLM move"""
     move_number: int
@@ -29,8 +31,14 @@ class MoveMetrics:
     confidence: float          # LLM confidence score (0-1)
     parsing_success: bool      # Was LLM response properly parsed
     response_length: int       # Length of LLM response in characters
+    from_reply: bool = True    # False for later moves queued from a multi-move reply
 
-@dataclass
+# Field names and a C-level getter for them; every field is a plain value, so
+# dict(zip(...)) replaces the generic deep-copying asdict()/astuple()
+_MOVE_FIELDS = tuple(f.name for f in fields(MoveMetrics))
+_move_values = attrgetter(*_MOVE_FIELDS)
+
+@dataclass(slots=True)
 class GameMetrics:
     """Track comprehensive game metrics for LLM evaluation"""
     board_size: int
@@ -64,17 +72,38 @@ class GameMetrics:
     late_error_rate: float = 0.0       # Errors in last 25% of moves
     recovery_rate: float = 0.0         # Recovery after bad moves
     optimal_deviation: float = 0.0     # Average distance from optimal path
+    _grade: Optional[str] = field(default=None, init=False, repr=False, compare=False)  # cached grade
+    _wandb_payload: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
     def calculate_all_metrics(self):
         """Calculate all derived metrics from move data"""
+        self._wandb_payload = None
         if not self.moves:
             return
             
-        # Basic counts
-        self.valid_moves = sum(1 for m in self.moves if m.is_valid)
-        self.bad_moves = sum(1 for m in self.moves if m.is_bad)
-        self.correct_moves = sum(1 for m in self.moves if m.is_correct)
-        self.clue_hits = sum(1 for m in self.moves if m.is_on_clue)
+        # Basic counts, latency, parsing and reasoning totals in a single pass.
+        # Per-reply stats only count moves that made an LLM call, so multi-move
+        # replies stay comparable with one-move-per-call runs.
+        valid = bad = correct = clues = parsing_successes = replies = 0
+        latency_sum = 0.0
+        reasoning_sum = reasoning_count = 0
+        for m in self.moves:
+            valid += m.is_valid
+            bad += m.is_bad
+            correct += m.is_correct
+            clues += m.is_on_clue
+            if not m.from_reply:
+                continue
+            replies += 1
+            parsing_successes += m.parsing_success
+            latency_sum += m.latency_ms
+            if m.reasoning:
+                reasoning_sum += len(m.reasoning)
+                reasoning_count += 1
+        self.valid_moves = valid
+        self.bad_moves = bad
+        self.correct_moves = correct
+        self.clue_hits = clues
         
         # Core performance metrics
         self.move_efficiency = (self.valid_moves / self.total_moves) if self.total_moves > 0 else 0.0
@@ -91,89 +120,82 @@ class GameMetrics:
         self.completion_ratio = len(self.llm_path) / self.total_cells if self.total_cells > 0 else 0.0
         
         # Latency metrics
-        if self.moves:
-            self.average_latency_ms = sum(m.latency_ms for m in self.moves) / len(self.moves)
+        self.average_latency_ms = latency_sum / replies if replies else 0.0
         
         # Quality metrics
-        parsing_successes = sum(1 for m in self.moves if m.parsing_success)
-        self.parsing_success_rate = (parsing_successes / self.total_moves) if self.total_moves > 0 else 0.0
+        self.parsing_success_rate = (parsing_successes / replies) if replies else 0.0
         
         # Reasoning quality (proxy: average reasoning length)
-        reasoning_lengths = [len(m.reasoning) for m in self.moves if m.reasoning]
-        self.reasoning_quality = sum(reasoning_lengths) / len(reasoning_lengths) if reasoning_lengths else 0.0
+        self.reasoning_quality = reasoning_sum / reasoning_count if reasoning_count else 0.0
         
         # Advanced metrics
         self._calculate_advanced_metrics()
+        
+        self._grade = self._compute_grade()
     
     def _calculate_advanced_metrics(self):
         """Calculate advanced performance metrics"""
         if len(self.moves) < 4:
             return
             
-        # Early vs late error rates
+        # Early vs late error rates (first / last 25% of moves)
         early_count = len(self.moves) // 4
         late_start = 3 * len(self.moves) // 4
         
-        early_moves = self.moves[:early_count]
-        late_moves = self.moves[late_start:]
-        
-        if early_moves:
-            early_errors = sum(1 for m in early_moves if m.is_bad)
-            self.early_error_rate = early_errors / len(early_moves)
-        
-        if late_moves:
-            late_errors = sum(1 for m in late_moves if m.is_bad)
-            self.late_error_rate = late_errors / len(late_moves)
-        
-        # Recovery rate: valid moves after bad moves
+        # Error rates, recovery, optimal deviation and consistency in a single pass
+        early_errors = 0
+        late_errors = 0
         recovery_opportunities = 0
         recoveries = 0
-        
-        for i in range(len(self.moves) - 1):
-            if self.moves[i].is_bad:
-                recovery_opportunities += 1
-                if self.moves[i + 1].is_valid:
-                    recoveries += 1
-        
-        self.recovery_rate = (recoveries / recovery_opportunities) if recovery_opportunities > 0 else 1.0
-        
-        # Optimal deviation: average Manhattan distance from expected position
-        deviations = []
-        for move in self.moves:
-            if move.expected_row >= 0 and move.expected_col >= 0:  # Valid expected position
-                deviation = abs(move.row - move.expected_row) + abs(move.col - move.expected_col)
-                deviations.append(deviation)
-        
-        self.optimal_deviation = sum(deviations) / len(deviations) if deviations else 0.0
-        
-        # Consistency score: how often consecutive moves follow a logical pattern
+        deviation_sum = 0
+        deviation_count = 0
         consistent_sequences = 0
         total_sequences = len(self.moves) - 1
         
-        for i in range(total_sequences):
-            current_move = self.moves[i]
-            next_move = self.moves[i + 1]
-            
-            # Check if moves are logically connected (adjacent, towards clue, etc.)
-            if self._is_consistent_sequence(current_move, next_move):
-                consistent_sequences += 1
+        prev = None
+        for i, move in enumerate(self.moves):
+            if move.is_bad:
+                if i < early_count:
+                    early_errors += 1
+                elif i >= late_start:
+                    late_errors += 1
+            if prev is not None:
+                # Recovery rate: valid moves after bad moves
+                if prev.is_bad:
+                    recovery_opportunities += 1
+                    if move.is_valid:
+                        recoveries += 1
+                # Consistency: consecutive moves logically connected (adjacent, towards clue, etc.)
+                if self._is_consistent_sequence(prev, move):
+                    consistent_sequences += 1
+            # Optimal deviation: Manhattan distance from expected position
+            if move.expected_row >= 0 and move.expected_col >= 0:  # Valid expected position
+                deviation_sum += abs(move.row - move.expected_row) + abs(move.col - move.expected_col)
+                deviation_count += 1
+            prev = move
         
+        self.early_error_rate = early_errors / early_count
+        self.late_error_rate = late_errors / (len(self.moves) - late_start)
+        self.recovery_rate = (recoveries / recovery_opportunities) if recovery_opportunities > 0 else 1.0
+        self.optimal_deviation = deviation_sum / deviation_count if deviation_count else 0.0
         self.consistency_score = (consistent_sequences / total_sequences) if total_sequences > 0 else 1.0
     
     def _is_consistent_sequence(self, move1: MoveMetrics, move2: MoveMetrics) -> bool:
         """Check if two consecutive moves form a consistent sequence"""
-        # Moves are consistent if they're adjacent and both valid
+        # Moves are consistent if they're both valid and adjacent (diagonals count here)
         if not (move1.is_valid and move2.is_valid):
             return False
-        
-        # Check adjacency (including diagonal for this consistency check)
-        row_diff = abs(move2.row - move1.row)
-        col_diff = abs(move2.col - move1.col)
-        
-        return (row_diff <= 1 and col_diff <= 1 and (row_diff + col_diff) > 0)
+        dr = move2.row - move1.row
+        dc = move2.col - move1.col
+        return -1 <= dr <= 1 and -1 <= dc <= 1 and (dr or dc) != 0
     
     def get_performance_grade(self) -> str:
-        """Get overall performance grade A-F"""
+        """Get overall performance grade A-F (cached by calculate_all_metrics)"""
+        if self._grade is None:
+            self._grade = self._compute_grade()
+        return self._grade
+    
+    def _compute_grade(self) -> str:
         score = (
             self.move_efficiency * 0.3 +
             self.path_accuracy * 0.3 +
@@ -188,9 +210,47 @@ class GameMetrics:
         elif score >= 0.6: return "D"
         else: return "F"
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for logging"""
-        return {
+    def wandb_payload(self) -> Dict:
+        """Scalar metrics keyed for wandb.log (built once per calculate_all_metrics)"""
+        if self._wandb_payload is None:
+            self._wandb_payload = {
+                # Game info
+                "board_size": self.board_size,
+                "puzzle_completed": self.puzzle_completed,
+                "completion_time_seconds": self.completion_time_seconds,
+                
+                # Core performance
+                "moves/total": self.total_moves,
+                "moves/valid": self.valid_moves,
+                "moves/bad": self.bad_moves,
+                "moves/correct": self.correct_moves,
+                "moves/clue_hits": self.clue_hits,
+                
+                # Key percentages
+                "performance/move_efficiency": self.move_efficiency,
+                "performance/path_accuracy": self.path_accuracy,
+                "performance/completion_ratio": self.completion_ratio,
+                "performance/grade": self.get_performance_grade(),
+                
+                # Latency
+                "latency/average_ms": self.average_latency_ms,
+                
+                # Quality
+                "quality/parsing_success_rate": self.parsing_success_rate,
+                "quality/reasoning_quality": self.reasoning_quality,
+                "quality/consistency_score": self.consistency_score,
+                
+                # Advanced
+                "advanced/early_error_rate": self.early_error_rate,
+                "advanced/late_error_rate": self.late_error_rate,
+                "advanced/recovery_rate": self.recovery_rate,
+                "advanced/optimal_deviation": self.optimal_deviation,
+            }
+        return self._wandb_payload
+    
+    def to_dict(self, include_moves: bool = True) -> Dict:
+        """Convert to dictionary for logging (include_moves=False skips the per-move details)"""
+        d = {
             # Basic info
             "board_size": self.board_size,
             "total_cells": self.total_cells,
@@ -221,24 +281,25 @@ class GameMetrics:
             "recovery_rate_percent": round(self.recovery_rate * 100, 1),
             "optimal_deviation_avg": round(self.optimal_deviation, 2),
             "performance_grade": self.get_performance_grade(),
-            
-            # Detailed move data
-            "moves_details": [asdict(m) for m in self.moves]
         }
+        if include_moves:
+            # Detailed move data
+            d["moves_details"] = [dict(zip(_MOVE_FIELDS, _move_values(m))) for m in self.moves]
+        return d
 
 class LLMMetricsCollector:
     """Enhanced metrics collector for LLM evaluation"""
     
     def __init__(self):
         self.game_metrics: Optional[GameMetrics] = None
-        self.move_start_time: float = 0
-        self.game_start_time: float = 0
+        self.move_start_ns: int = 0  # time.perf_counter_ns() stamps
+        self.game_start_ns: int = 0
         self.solver_path: List[Tuple[int, int]] = []
         self.current_move_number: int = 0
     
     def start_game(self, board_size: int, solver_path: List[Tuple[int, int]] = None):
         """Initialize metrics for a new game"""
-        self.game_start_time = time.time()
+        self.game_start_ns = time.perf_counter_ns()
         self.current_move_number = 0
         self.solver_path = solver_path or []
         
@@ -256,23 +317,27 @@ class LLMMetricsCollector:
     
     def start_move(self):
         """Start timing a move"""
-        self.move_start_time = time.time()
+        self.move_start_ns = time.perf_counter_ns()
         self.current_move_number += 1
     
     def record_move(self, row: int, col: int, is_valid: bool, current_path: List[Tuple[int, int]], 
                    reasoning: str = "", confidence: float = 0.5, parsing_success: bool = True, 
-                   response_length: int = 0):
-        """Record a move with comprehensive metrics"""
+                   response_length: int = 0, from_reply: bool = True,
+                   visited: Optional[Set[Tuple[int, int]]] = None):
+        """Record a move with comprehensive metrics (from_reply=False for moves queued
+        from an earlier multi-move reply; they carry no latency or response of their own).
+        Callers that keep a set of the cells in current_path can pass it as visited
+        for an O(1) revisit check."""
         if not self.game_metrics:
             return
         
-        latency_ms = (time.time() - self.move_start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - self.move_start_ns) / 1e6
         self.game_metrics.total_moves += 1
         
         # Determine if move is bad (visited or invalid position)
         attempted_cell = (row, col)
         is_bad = (
-            attempted_cell in current_path or  # Already visited
+            attempted_cell in (current_path if visited is None else visited) or  # Already visited
             not is_valid or                   # Invalid move (out of bounds, not adjacent)
             row < 0 or col < 0               # Invalid coordinates
         )
@@ -308,14 +373,15 @@ class LLMMetricsCollector:
             reasoning=reasoning[:100],  # Truncate reasoning
             confidence=confidence,
             parsing_success=parsing_success,
-            response_length=response_length
+            response_length=response_length,
+            from_reply=from_reply
         )
         
         self.game_metrics.moves.append(move_metric)
         
-        logger.info(f"Move {self.current_move_number}: ({row}, {col}) - "
-                   f"Valid: {move_metric.is_valid}, Correct: {is_correct}, "
-                   f"Latency: {latency_ms:.0f}ms")
+        # %-style args: the message is only formatted if INFO is actually emitted
+        logger.info("Move %d: (%d, %d) - Valid: %s, Correct: %s, Latency: %.0fms",
+                    self.current_move_number, row, col, move_metric.is_valid, is_correct, latency_ms)
     
     def update_move_clue_info(self, move_index: int, is_on_clue: bool, clue_number: int = None):
         """Update clue information for a move (called after board state check)"""
@@ -329,7 +395,7 @@ class LLMMetricsCollector:
             return None
         
         self.game_metrics.puzzle_completed = success
-        self.game_metrics.completion_time_seconds = time.time() - self.game_start_time
+        self.game_metrics.completion_time_seconds = (time.perf_counter_ns() - self.game_start_ns) / 1e9
         self.game_metrics.calculate_all_metrics()
         
         logger.info(f"Game ended - Success: {success}, "
@@ -339,49 +405,27 @@ class LLMMetricsCollector:
     
     def log_to_wandb(self, llm_provider: str, model_name: str = ""):
         """Log metrics to wandb with detailed breakdown"""
-        if not self.game_metrics or not WANDB_AVAILABLE:
+        if not self.game_metrics or not WANDB_AVAILABLE or not ENABLE_WANDB:
             return
         
         try:
-            metrics_dict = self.game_metrics.to_dict()
+            # Start the session run on first use, unless a script already started one
+            if wandb.run is None:
+                wandb.init(project=WANDB_PROJECT, name=f"session-{time.strftime('%Y%m%d-%H%M%S')}")
             
             # Log main metrics with provider info
             wandb.log({
-                # Game info
                 "llm_provider": llm_provider,
                 "model_name": model_name,
-                "board_size": self.game_metrics.board_size,
-                "puzzle_completed": self.game_metrics.puzzle_completed,
-                "completion_time_seconds": self.game_metrics.completion_time_seconds,
-                
-                # Core performance
-                "moves/total": self.game_metrics.total_moves,
-                "moves/valid": self.game_metrics.valid_moves,
-                "moves/bad": self.game_metrics.bad_moves,
-                "moves/correct": self.game_metrics.correct_moves,
-                "moves/clue_hits": self.game_metrics.clue_hits,
-                
-                # Key percentages
-                "performance/move_efficiency": self.game_metrics.move_efficiency,
-                "performance/path_accuracy": self.game_metrics.path_accuracy,
-                "performance/completion_ratio": self.game_metrics.completion_ratio,
-                "performance/grade": self.game_metrics.get_performance_grade(),
-                
-                # Latency
-                "latency/average_ms": self.game_metrics.average_latency_ms,
-                
-                # Quality
-                "quality/parsing_success_rate": self.game_metrics.parsing_success_rate,
-                "quality/reasoning_quality": self.game_metrics.reasoning_quality,
-                "quality/consistency_score": self.game_metrics.consistency_score,
-                
-                # Advanced
-                "advanced/early_error_rate": self.game_metrics.early_error_rate,
-                "advanced/late_error_rate": self.game_metrics.late_error_rate,
-                "advanced/recovery_rate": self.game_metrics.recovery_rate,
-                "advanced/optimal_deviation": self.game_metrics.optimal_deviation,
+                **self.game_metrics.wandb_payload(),
             })
             
+            if WANDB_LOG_MOVES:
+                wandb.log({"moves/details": wandb.Table(
+                    columns=list(_MOVE_FIELDS),
+                    data=[list(_move_values(m)) for m in self.game_metrics.moves],
+                )})
+            
             logger.info("Comprehensive metrics logged to wandb")
         except Exception as e:
             logger.error(f"Error logging to wandb: {e}")
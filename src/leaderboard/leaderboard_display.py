@@ -1,15 +1,45 @@
 import pygame
 import sys
+from itertools import accumulate
 from typing import List, Dict, Optional, Tuple
 from leaderboard.leaderboard_enhanced import enhanced_leaderboard, EnhancedScore
 from config.config import BOARD_SIZES
 
+TEXT_CACHE_LIMIT = 512  # rendered text surfaces kept before the cache is reset
+
+# Category table layout: columns as (title, width), their text x offsets, and
+# the table body height (column header + 5 rows)
+TABLE_COLS = (
+    ("Rank", 60), ("Player", 200), ("Model/Details", 200),
+    ("Time", 100), ("Score", 100), ("Efficiency", 100),
+)
+_COL_XS = tuple(accumulate((w for _, w in TABLE_COLS[:-1]), initial=50))
+TABLE_HEIGHT = 30 + 5 * 25
+
+# Fonts shared by every display instance, keyed by (name, size, bold); name None is pygame's default font
+_FONT_CACHE: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+
+def _get_font(name: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """SysFont/Font loaded once per pygame session instead of once per display"""
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if not _FONT_CACHE:
+            # Fonts are invalid (and crash on render) after pygame.quit(), so
+            # forget them then; pygame drops quit hooks once they have run
+            pygame.register_quit(_FONT_CACHE.clear)
+        font = pygame.font.SysFont(name, size, bold=bold) if name else pygame.font.Font(None, size)
+        _FONT_CACHE[key] = font
+    return font
+
 class EnhancedLeaderboardDisplay:
     """Displays leaderboard in tabular format with selectable board sizes and categories"""
     
     def __init__(self, screen_width: int = 1200, screen_height: int = 800):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self._table_w = screen_width - 80        # section header / table outer width
+        self._table_inner_w = screen_width - 82  # inside the table border
         self.screen = None
         self.clock = pygame.time.Clock()
         
@@ -36,6 +66,8 @@ class EnhancedLeaderboardDisplay:
             'ollama': (245, 158, 11)
         }
         
+        self._text_cache: Dict[Tuple[str, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._button_cache: Dict[tuple, pygame.Surface] = {}  # (size, color, text) -> finished button
         self._init_fonts()
     
     def _init_fonts(self):
@@ -44,104 +76,159 @@ class EnhancedLeaderboardDisplay:
         for name in font_names:
             try:
                 self.fonts = {
-                    'title': pygame.font.SysFont(name, 32, bold=True),
-                    'header': pygame.font.SysFont(name, 20, bold=True),
-                    'table_head': pygame.font.SysFont(name, 14, bold=True),
-                    'table_row': pygame.font.SysFont(name, 14),
-                    'button': pygame.font.SysFont(name, 16, bold=True),
-                    'small': pygame.font.SysFont(name, 12)
+                    'title': _get_font(name, 32, bold=True),
+                    'header': _get_font(name, 20, bold=True),
+                    'table_head': _get_font(name, 14, bold=True),
+                    'table_row': _get_font(name, 14),
+                    'button': _get_font(name, 16, bold=True),
+                    'small': _get_font(name, 12)
                 }
                 break
             except:
                 continue
         if not self.fonts:
             self.fonts = {
-                'title': pygame.font.Font(None, 32),
-                'header': pygame.font.Font(None, 24),
-                'table_head': pygame.font.Font(None, 18),
-                'table_row': pygame.font.Font(None, 18),
-                'button': pygame.font.Font(None, 20),
-                'small': pygame.font.Font(None, 16)
+                'title': _get_font(None, 32),
+                'header': _get_font(None, 24),
+                'table_head': _get_font(None, 18),
+                'table_row': _get_font(None, 18),
+                'button': _get_font(None, 20),
+                'small': _get_font(None, 16)
             }
 
+    def _render(self, font_key: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """font.render with a cache; labels and scores repeat every frame"""
+        key = (font_key, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surf = self.fonts[font_key].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def draw_rounded_rect(self, surface, rect, color, radius=8, border_color=None, width=0):
         pygame.draw.rect(surface, color, rect, border_radius=radius)
         if border_color and width > 0:
             pygame.draw.rect(surface, border_color, rect, width, border_radius=radius)
 
-    def draw_button(self, rect, text, base_color, mouse_pos):
-        """Helper to draw interactive buttons"""
-        hover = rect.collidepoint(mouse_pos)
+    def draw_button(self, rect, text, base_color, mouse_pos, hover=None):
+        """Helper to draw interactive buttons (hover may be precomputed by the caller)"""
+        if hover is None:
+            hover = rect.collidepoint(mouse_pos)
         color = tuple(min(255, c + 20) for c in base_color) if hover else base_color
         
-        self.draw_rounded_rect(self.screen, rect, color, radius=8)
-        
-        txt_surf = self.fonts['button'].render(text, True, (255, 255, 255))
-        txt_rect = txt_surf.get_rect(center=rect.center)
-        self.screen.blit(txt_surf, txt_rect)
+        # Each button/state is rasterised once, then blitted as a converted surface
+        key = (rect.size, color, text)
+        surf = self._button_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+            area = surf.get_rect()
+            self.draw_rounded_rect(surf, area, color, radius=8)
+            
+            txt_surf = self._render('button', text, (255, 255, 255))
+            txt_rect = txt_surf.get_rect(center=area.center)
+            surf.blit(txt_surf, txt_rect)
+            surf = surf.convert_alpha()
+            self._button_cache[key] = surf
+        self.screen.blit(surf, rect)
         
         return hover
 
+    def _present(self, buttons, hit, last_hit, dirty):
+        """Push changed screen areas and return the hovered button index for the next frame.
+        With last_hit None the whole frame is flipped; otherwise only the dirty rects
+        and the buttons entering/leaving hover are updated (nothing, on an idle frame)."""
+        if last_hit is None:
+            pygame.display.flip()
+        else:
+            if hit != last_hit:
+                dirty.extend(buttons[i] for i in (last_hit, hit) if i >= 0)
+            if dirty:
+                pygame.display.update(dirty)
+        return hit
+
+    def _wait_events(self) -> list:
+        """Sleep until input arrives (at most 100 ms) and return the pending events.
+        An empty list means nothing happened, so there is nothing new to draw."""
+        event = pygame.event.wait(100)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def show_board_selection(self) -> Optional[int]:
         """Show grid of buttons to select board size"""
-        pygame.init()
+        if not pygame.get_init():
+            pygame.init()
         self.screen = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("Leaderboard - Select Board Size")
         
-        available = enhanced_leaderboard.get_available_board_sizes()
+        available = set(enhanced_leaderboard.get_available_board_sizes())
         display_sizes = BOARD_SIZES
+        last_hit = None
+        
+        # Grid of sizes: (size, rect, color) laid out once, not every frame
+        cols = 3
+        w, h = 140, 60
+        gap = 20
+        start_x = (800 - (cols * w + (cols-1)*gap)) // 2
+        start_y = 150
+        size_buttons = []
+        for i, size in enumerate(display_sizes):
+            r, c = i // cols, i % cols
+            rect = pygame.Rect(start_x + c*(w+gap), start_y + r*(h+gap), w, h)
+            has_data = size in available
+            base_color = self.colors['header'] if has_data else (200, 200, 200)
+            size_buttons.append((size, rect, base_color))
+        
+        # Bottom Buttons
+        btn_w, btn_h = 160, 50
+        menu_rect = pygame.Rect(400 - btn_w - 10, 500, btn_w, btn_h)
+        exit_rect = pygame.Rect(400 + 10, 500, btn_w, btn_h)
+        buttons = [rect for _, rect, _ in size_buttons] + [menu_rect, exit_rect]
+        menu_idx = len(size_buttons)
         
         running = True
         while running:
-            self.clock.tick(60)
+            self.clock.tick(30)  # static screen, no animation to keep smooth
+            events = self._wait_events()
+            if not events and last_hit is not None:
+                continue
             self.screen.fill(self.colors['bg'])
             mx, my = pygame.mouse.get_pos()
             
             # Title
-            title = self.fonts['title'].render("Select Board Size", True, self.colors['text_primary'])
+            title = self._render('title', "Select Board Size", self.colors['text_primary'])
             self.screen.blit(title, title.get_rect(center=(400, 80)))
             
             click = False
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return None
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     return None
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     click = True
+                if event.type == pygame.WINDOWEXPOSED:
+                    last_hit = None
 
-            # Grid of sizes
-            cols = 3
-            w, h = 140, 60
-            gap = 20
-            start_x = (800 - (cols * w + (cols-1)*gap)) // 2
-            start_y = 150
+            # One C-level hit test instead of a collidepoint per button
+            hit = pygame.Rect((mx, my), (1, 1)).collidelist(buttons)
             
-            for i, size in enumerate(display_sizes):
-                r, c = i // cols, i % cols
-                rect = pygame.Rect(start_x + c*(w+gap), start_y + r*(h+gap), w, h)
-                
-                has_data = size in available
-                base_color = self.colors['header'] if has_data else (200, 200, 200)
-                
-                if self.draw_button(rect, f"{size}x{size}", base_color, (mx, my)):
+            for i, (size, rect, base_color) in enumerate(size_buttons):
+                if self.draw_button(rect, f"{size}x{size}", base_color, (mx, my), i == hit):
                     if click:
                         return size
             
-            # Bottom Buttons
-            btn_w, btn_h = 160, 50
-            menu_rect = pygame.Rect(400 - btn_w - 10, 500, btn_w, btn_h)
-            exit_rect = pygame.Rect(400 + 10, 500, btn_w, btn_h)
-            
-            if self.draw_button(menu_rect, "Back to Menu", self.colors['btn_back'], (mx, my)):
+            if self.draw_button(menu_rect, "Back to Menu", self.colors['btn_back'], (mx, my), hit == menu_idx):
                 if click: return None
             
-            if self.draw_button(exit_rect, "Exit Game", self.colors['btn_exit'], (mx, my)):
+            if self.draw_button(exit_rect, "Exit Game", self.colors['btn_exit'], (mx, my), hit == menu_idx + 1):
                 if click:
                     pygame.quit()
                     sys.exit(0)
             
-            pygame.display.flip()
+            last_hit = self._present(buttons, hit, last_hit, [])
         return None
 
     def show_results(self, board_size: int) -> str:
@@ -168,17 +255,43 @@ class EnhancedLeaderboardDisplay:
         footer_height = 80
         view_height = self.screen_height - footer_height
         
+        # Calculate content height
+        total_content_height = 100 + len(section_order) * 200
+        max_scroll = max(0, total_content_height - view_height)
+        
+        # --- Draw Content ---
+        # The tables don't change while this view is open, so render them once
+        # to a full-height surface and only blit the scrolled window per frame
+        content_surface = pygame.Surface((self.screen_width, max(total_content_height, view_height)))
+        content_surface.fill(self.colors['bg'])
+        
+        current_y = 20
+        
+        # Main Title
+        title = self._render('title', f"{board_size}x{board_size} Leaderboard", self.colors['text_primary'])
+        content_surface.blit(title, (40, current_y))
+        current_y += 60
+        
+        # Draw Sections
+        for title_text, key in section_order:
+            scores = data.get(key, [])
+            color = self.colors.get(key, self.colors['header'])
+            current_y = self._draw_section(content_surface, current_y, title_text, scores, color)
+            current_y += 30 # Spacing
+        
+        last_scroll = scroll_y
+        last_hit = None
+        
         running = True
         while running:
             self.clock.tick(60)
+            events = self._wait_events()
+            if not events and last_hit is not None:
+                continue
             mx, my = pygame.mouse.get_pos()
             
-            # Calculate content height
-            total_content_height = 100 + len(section_order) * 200
-            max_scroll = max(0, total_content_height - view_height)
-            
             click = False
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return "exit"
                 if event.type == pygame.KEYDOWN:
@@ -192,29 +305,11 @@ class EnhancedLeaderboardDisplay:
                     scroll_y = max(0, min(max_scroll, scroll_y - event.y * 30))
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     click = True
+                if event.type == pygame.WINDOWEXPOSED:
+                    last_hit = None
             
-            self.screen.fill(self.colors['bg'])
-            
-            # --- Draw Content ---
-            content_surface = pygame.Surface((self.screen_width, view_height))
-            content_surface.fill(self.colors['bg'])
-            
-            current_y = 20 - scroll_y
-            
-            # Main Title
-            title = self.fonts['title'].render(f"{board_size}x{board_size} Leaderboard", True, self.colors['text_primary'])
-            content_surface.blit(title, (40, current_y))
-            current_y += 60
-            
-            # Draw Sections
-            for title_text, key in section_order:
-                scores = data.get(key, [])
-                color = self.colors.get(key, self.colors['header'])
-                current_y = self._draw_section(content_surface, current_y, title_text, scores, color)
-                current_y += 30 # Spacing
-            
-            # Blit content
-            self.screen.blit(content_surface, (0, 0))
+            # Blit the visible slice of the content
+            self.screen.blit(content_surface, (0, 0), pygame.Rect(0, scroll_y, self.screen_width, view_height))
             
             # Scrollbar
             if max_scroll > 0:
@@ -237,89 +332,101 @@ class EnhancedLeaderboardDisplay:
             rect_back = pygame.Rect(start_x, btn_y, btn_w, btn_h)
             rect_menu = pygame.Rect(start_x + btn_w + spacing, btn_y, btn_w, btn_h)
             rect_exit = pygame.Rect(start_x + 2 * (btn_w + spacing), btn_y, btn_w, btn_h)
+            buttons = [rect_back, rect_menu, rect_exit]
+            hit = pygame.Rect((mx, my), (1, 1)).collidelist(buttons)
             
-            if self.draw_button(rect_back, "< Select Board Size", self.colors['btn_back'], (mx, my)):
+            if self.draw_button(rect_back, "< Select Board Size", self.colors['btn_back'], (mx, my), hit == 0):
                 if click: return "back"
             
-            if self.draw_button(rect_menu, "Main Menu", self.colors['btn_menu'], (mx, my)):
+            if self.draw_button(rect_menu, "Main Menu", self.colors['btn_menu'], (mx, my), hit == 1):
                 if click: return "menu"
                 
-            if self.draw_button(rect_exit, "Exit", self.colors['btn_exit'], (mx, my)):
+            if self.draw_button(rect_exit, "Exit", self.colors['btn_exit'], (mx, my), hit == 2):
                 if click: return "exit"
 
-            pygame.display.flip()
+            # Scrolling moves the whole content area, scrollbar included
+            dirty = []
+            if scroll_y != last_scroll:
+                dirty.append(pygame.Rect(0, 0, self.screen_width, view_height))
+                last_scroll = scroll_y
+            last_hit = self._present(buttons, hit, last_hit, dirty)
         
         return "back"
 
     def _draw_section(self, surface, y: int, title: str, scores: List[EnhancedScore], color: Tuple[int,int,int]) -> int:
         """Draw a single category table onto the given surface"""
         # Header
-        self.draw_rounded_rect(surface, pygame.Rect(40, y, self.screen_width-80, 30), color, radius=5)
-        txt = self.fonts['header'].render(title, True, (255,255,255))
+        self.draw_rounded_rect(surface, pygame.Rect(40, y, self._table_w, 30), color, radius=5)
+        txt = self._render('header', title, (255,255,255))
         surface.blit(txt, (50, y+5))
         
         y += 35
         
         # Table Background
-        table_h = 30 + 5 * 25 # Header + 5 rows
-        pygame.draw.rect(surface, self.colors['card'], (40, y, self.screen_width-80, table_h))
-        pygame.draw.rect(surface, self.colors['border'], (40, y, self.screen_width-80, table_h), 1)
+        pygame.draw.rect(surface, self.colors['card'], (40, y, self._table_w, TABLE_HEIGHT))
+        pygame.draw.rect(surface, self.colors['border'], (40, y, self._table_w, TABLE_HEIGHT), 1)
         
-        # Columns: Rank, Player, Model, Time, Score
-        cols = [
-            ("Rank", 60), ("Player", 200), ("Model/Details", 200), 
-            ("Time", 100), ("Score", 100), ("Efficiency", 100)
-        ]
+        # Text is collected here and drawn with one batched blit call at the end
+        seq = []
         
         # Draw Column Headers
-        cx = 50
-        pygame.draw.rect(surface, self.colors['table_header'], (41, y+1, self.screen_width-82, 24))
-        for name, w in cols:
-            surf = self.fonts['table_head'].render(name, True, self.colors['text_primary'])
-            surface.blit(surf, (cx, y+5))
-            cx += w
+        pygame.draw.rect(surface, self.colors['table_header'], (41, y+1, self._table_inner_w, 24))
+        for (name, _), cx in zip(TABLE_COLS, _COL_XS):
+            seq.append((self._render('table_head', name, self.colors['text_primary']), (cx, y+5)))
         
         y += 25
         
         # Draw Rows (Max 5)
         if not scores:
-            none_txt = self.fonts['table_row'].render("No scores recorded yet", True, self.colors['text_secondary'])
-            surface.blit(none_txt, (50, y+10))
+            seq.append((self._render('table_row', "No scores recorded yet", self.colors['text_secondary']), (50, y+10)))
+            self._blit_batch(surface, seq)
             return y + 5 * 25
+        
+        x_rank, x_player, x_model, x_time, x_score, x_eff = _COL_XS
+        for i, s in enumerate(scores[:5]):
+            row_y = y + i * 25
+            if i % 2 == 1:
+                pygame.draw.rect(surface, self.colors['table_alt'], (41, row_y, self._table_inner_w, 25))
+            text_y = row_y + 5
             
-        for i in range(5):
-            if i < len(scores):
-                s = scores[i]
-                row_y = y + i * 25
-                if i % 2 == 1:
-                    pygame.draw.rect(surface, self.colors['table_alt'], (41, row_y, self.screen_width-82, 25))
-                
-                cx = 50
-                # Rank
-                surface.blit(self.fonts['table_row'].render(f"#{i+1}", True, self.colors['text_primary']), (cx, row_y+5))
-                cx += cols[0][1]
-                # Player
-                surface.blit(self.fonts['table_row'].render(s.player_name[:20], True, self.colors['text_primary']), (cx, row_y+5))
-                cx += cols[1][1]
-                # Model
-                mod = s.model_name if s.model_name else "-"
-                surface.blit(self.fonts['table_row'].render(mod[:25], True, self.colors['text_secondary']), (cx, row_y+5))
-                cx += cols[2][1]
-                # Time
-                surface.blit(self.fonts['table_row'].render(f"{s.time_seconds}s", True, self.colors['text_primary']), (cx, row_y+5))
-                cx += cols[3][1]
-                # Score
-                surface.blit(self.fonts['table_row'].render(f"{s.score():.0f}", True, self.colors['text_primary']), (cx, row_y+5))
-                cx += cols[4][1]
-                # Efficiency
-                eff = f"{s.move_efficiency:.0%}" if s.move_efficiency else "-"
-                surface.blit(self.fonts['table_row'].render(eff, True, self.colors['text_secondary']), (cx, row_y+5))
+            # Rank
+            seq.append((self._render('table_row', f"#{i+1}", self.colors['text_primary']), (x_rank, text_y)))
+            # Player
+            seq.append((self._render('table_row', s.player_name[:20], self.colors['text_primary']), (x_player, text_y)))
+            # Model
+            mod = s.model_name if s.model_name else "-"
+            seq.append((self._render('table_row', mod[:25], self.colors['text_secondary']), (x_model, text_y)))
+            # Time
+            seq.append((self._render('table_row', f"{s.time_seconds}s", self.colors['text_primary']), (x_time, text_y)))
+            # Score
+            seq.append((self._render('table_row', f"{s.score():.0f}", self.colors['text_primary']), (x_score, text_y)))
+            # Efficiency
+            eff = f"{s.move_efficiency:.0%}" if s.move_efficiency else "-"
+            seq.append((self._render('table_row', eff, self.colors['text_secondary']), (x_eff, text_y)))
 
+        self._blit_batch(surface, seq)
         return y + 5 * 25
 
+    def _blit_batch(self, surface, seq):
+        """Blit (source, dest) pairs in one call; fblits where pygame-ce provides it"""
+        blit_batch = getattr(surface, 'fblits', None)
+        if blit_batch:
+            blit_batch(seq)
+        else:
+            surface.blits(seq, doreturn=False)
+
+# One display per process, so its text cache survives between visits
+_display: Optional[EnhancedLeaderboardDisplay] = None
+
 def show_enhanced_leaderboard(screen=None):
     """Entry point with navigation loop"""
-    display = EnhancedLeaderboardDisplay()
+    global _display
+    if _display is None:
+        _display = EnhancedLeaderboardDisplay()
+    else:
+        # Cheap when the fonts are still cached; reloads them if pygame was quit since
+        _display._init_fonts()
+    display = _display
     
     while True:
         # Step 1: Select Board Size
@@ -1,11 +1,24 @@
+import bisect
 import json
 import os
+from operator import attrgetter
 from typing import List, Dict, Optional
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from config.config import LEADERBOARD_FILE, LEADERBOARD_MAX_ENTRIES, DIFFICULTY_MULTIPLIER
+from dataclasses import dataclass, field
+from config.config import (
+    LEADERBOARD_FILE, LEADERBOARD_LOG_FILE, LEADERBOARD_COMPACT_EVERY,
+    LEADERBOARD_MAX_ENTRIES, DIFFICULTY_MULTIPLIER,
+)
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+@dataclass(slots=True)
 class EnhancedScore:
     """Enhanced score tracking for both human and LLM players"""
     player_name: str
@@ -16,13 +29,19 @@ class EnhancedScore:
     model_name: Optional[str] = None  # For LLMs: "gpt-4", "claude-3-sonnet", etc.
     move_efficiency: Optional[float] = None  # For LLMs: valid_moves / total_moves
     path_accuracy: Optional[float] = None    # For LLMs: path following accuracy
+    _score: float = field(default=0.0, init=False, repr=False, compare=False)  # cached score()
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now().isoformat()
+        # Scores are never edited after creation, so compute once
+        self._score = self._compute_score()
     
     def score(self) -> float:
-        """Calculate enhanced score with LLM bonuses"""
+        """Enhanced score with LLM bonuses"""
+        return self._score
+    
+    def _compute_score(self) -> float:
         base_multiplier = DIFFICULTY_MULTIPLIER.get(self.board_size, 1.0)
         # Avoid division by zero
         t = max(1, self.time_seconds)
@@ -37,6 +56,12 @@ class EnhancedScore:
         
         return base_score
     
+    def same_category(self, other: 'EnhancedScore') -> bool:
+        """True if other is ranked in the same board size / player category as this score"""
+        if self.board_size != other.board_size or self.player_type != other.player_type:
+            return False
+        return self.player_type == "human" or self.player_name.lower() == other.player_name.lower()
+    
     def display_name(self) -> str:
         """Get formatted display name"""
         if self.player_type == "human":
@@ -44,44 +69,120 @@ class EnhancedScore:
         return f"{self.player_name} ({self.model_name or 'Unknown'})"
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Every field is a plain value, so a literal dict is enough (asdict deep-copies);
+        # the cached _score is derived and deliberately left out
+        return {
+            "player_name": self.player_name,
+            "board_size": self.board_size,
+            "time_seconds": self.time_seconds,
+            "timestamp": self.timestamp,
+            "player_type": self.player_type,
+            "model_name": self.model_name,
+            "move_efficiency": self.move_efficiency,
+            "path_accuracy": self.path_accuracy,
+        }
     
     @classmethod
     def from_dict(cls, d: Dict) -> 'EnhancedScore':
         return cls(**d)
 
+def _score_from_dict(d: Dict) -> EnhancedScore:
+    # Handle migration from old format
+    if 'player_type' not in d:
+        d['player_type'] = 'human'
+    return EnhancedScore.from_dict(d)
+
 class EnhancedLeaderboard:
-    """Enhanced leaderboard supporting both human and LLM players with categorization"""
+    """Enhanced leaderboard supporting both human and LLM players with categorization
+
+    LEADERBOARD_FILE holds a full snapshot; each new score is only appended as one
+    line to LEADERBOARD_LOG_FILE, which compact() folds back into the snapshot.
+    Nothing is read until the leaderboard is first used (see _ensure_loaded).
+    """
     
     def __init__(self):
         self.scores: List[EnhancedScore] = []
-        self.load()
+        self._pending = 0  # scores in the log since the last compaction
+        self._loaded = False
+    
+    def _ensure_loaded(self):
+        """Load on first use, so importing this module doesn't parse the files"""
+        if not self._loaded:
+            self.load()
     
     def load(self):
-        """Load leaderboard from file"""
+        """Load the leaderboard snapshot, then replay scores appended since"""
+        self.scores = []
+        self._pending = 0
+        self._loaded = True
         if os.path.exists(LEADERBOARD_FILE):
             try:
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.scores = []
-                    for d in data:
-                        # Handle migration from old format
-                        if isinstance(d, dict):
-                            if 'player_type' not in d:
-                                d['player_type'] = 'human'
-                            self.scores.append(EnhancedScore.from_dict(d))
+                with open(LEADERBOARD_FILE, 'rb') as f:
+                    data = _loads(f.read())
+                self.scores = [_score_from_dict(d) for d in data if isinstance(d, dict)]
             except Exception as e:
                 print(f"[Leaderboard] Error loading: {e}")
                 self.scores = []
+        if os.path.exists(LEADERBOARD_LOG_FILE):
+            try:
+                with open(LEADERBOARD_LOG_FILE, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            self.scores.append(_score_from_dict(_loads(line)))
+                            self._pending += 1
+            except Exception as e:
+                # Keep whatever replayed cleanly; a torn last line is the usual culprit
+                print(f"[Leaderboard] Error loading log: {e}")
+        # Kept sorted by score descending from here on
+        self.scores.sort(key=attrgetter('_score'), reverse=True)
+        del self.scores[LEADERBOARD_MAX_ENTRIES * 20:]
     
     def save(self):
-        """Save leaderboard to file"""
+        """Save the full leaderboard snapshot to file"""
+        self._ensure_loaded()  # never overwrite the file with an unloaded, empty list
         try:
             data = [s.to_dict() for s in self.scores]
-            with open(LEADERBOARD_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp = LEADERBOARD_FILE + ".tmp"
+            if ORJSON_AVAILABLE:
+                with open(tmp, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                # One dumps + write instead of json.dump's many small writes
+                with open(tmp, 'w') as f:
+                    f.write(json.dumps(data, indent=2))
+            # Swap the finished file in, so a crash mid-write never leaves a
+            # truncated snapshot (compact() deletes the log right after this)
+            os.replace(tmp, LEADERBOARD_FILE)
+            return True
         except Exception as e:
             print(f"[Leaderboard] Error saving: {e}")
+            return False
+    
+    def compact(self):
+        """Rewrite the snapshot and drop the append log it now covers"""
+        if self.save():
+            try:
+                if os.path.exists(LEADERBOARD_LOG_FILE):
+                    os.remove(LEADERBOARD_LOG_FILE)
+                self._pending = 0
+            except OSError as e:
+                print(f"[Leaderboard] Error clearing log: {e}")
+    
+    def _append(self, score: EnhancedScore):
+        """Append one score to the log (a single small write), compacting every so often"""
+        try:
+            if ORJSON_AVAILABLE:
+                with open(LEADERBOARD_LOG_FILE, 'ab') as f:
+                    f.write(orjson.dumps(score.to_dict()) + b'\n')
+            else:
+                with open(LEADERBOARD_LOG_FILE, 'a') as f:
+                    f.write(json.dumps(score.to_dict()) + '\n')
+            self._pending += 1
+        except Exception as e:
+            print(f"[Leaderboard] Error appending: {e}")
+            self._pending = LEADERBOARD_COMPACT_EVERY  # fall back to a full rewrite
+        if self._pending >= LEADERBOARD_COMPACT_EVERY:
+            self.compact()
     
     def add_human_score(self, player_name: str, board_size: int, time_seconds: int) -> int:
         """Add score for human player"""
@@ -110,33 +211,33 @@ class EnhancedLeaderboard:
         return self._add_score_internal(score)
     
     def _add_score_internal(self, score: EnhancedScore) -> int:
-        """Internal method to add score, sort, and return rank"""
-        self.scores.append(score)
-        # Sort by score descending
-        self.scores.sort(key=lambda s: s.score(), reverse=True)
+        """Internal method to add score into the sorted list and return its rank"""
+        self._ensure_loaded()
+        # Scores stay sorted by score descending; equal scores keep insertion order
+        key = lambda s: -s._score
+        idx = bisect.bisect_right(self.scores, key(score), key=key)
+        self.scores.insert(idx, score)
         
         # Keep manageable size (per category filtering happens on display)
-        if len(self.scores) > LEADERBOARD_MAX_ENTRIES * 20:
-             self.scores = self.scores[:LEADERBOARD_MAX_ENTRIES * 20]
+        cap = LEADERBOARD_MAX_ENTRIES * 20
+        del self.scores[cap:]
         
-        self.save()
+        self._append(score)
         
-        # Calculate rank within its specific category and board size
-        category_scores = self.get_scores_by_category(score.board_size, score.player_type, score.player_name)
-        for i, s in enumerate(category_scores):
-            if (s.player_name == score.player_name and 
-                s.timestamp == score.timestamp and 
-                s.time_seconds == score.time_seconds):
-                return i + 1
-        return -1
+        if idx >= cap:
+            return -1
+        # Rank within its specific category and board size
+        return 1 + sum(1 for s in self.scores[:idx] if score.same_category(s))
 
     def get_available_board_sizes(self) -> List[int]:
         """Return sorted list of board sizes that have data"""
+        self._ensure_loaded()
         sizes = set(s.board_size for s in self.scores)
         return sorted(list(sizes))
 
     def get_scores_by_category(self, board_size: int, player_type: str, provider_name: str = None) -> List[EnhancedScore]:
-        """Filter scores by board size and type/provider"""
+        """Filter scores by board size and type/provider (self.scores is already in rank order)"""
+        self._ensure_loaded()
         filtered = [s for s in self.scores if s.board_size == board_size]
         
         if player_type == "overall":
@@ -150,24 +251,34 @@ class EnhancedLeaderboard:
                 # Filter specific LLM provider (e.g., "openai", "claude")
                 filtered = [s for s in filtered if s.player_name.lower() == provider_name.lower()]
         
-        return sorted(filtered, key=lambda s: s.score(), reverse=True)
+        return filtered
 
     def get_leaderboard_data(self, board_size: int) -> Dict[str, List[EnhancedScore]]:
         """Get top 5 scores for all required categories for a specific board size"""
-        data = {}
-        
-        # 1. Overall
-        data["overall"] = self.get_scores_by_category(board_size, "overall")[:5]
+        self._ensure_loaded()
+        overall, human = [], []
+        llm_providers = ["openai", "claude", "gemini", "ollama"]
+        providers = {provider: [] for provider in llm_providers}
         
-        # 2. Human Only
-        data["human"] = self.get_scores_by_category(board_size, "human")[:5]
+        # self.scores is sorted by score, so a single pass fills every
+        # category in rank order instead of filtering once per category
+        for s in self.scores:
+            if s.board_size != board_size:
+                continue
+            # 1. Overall
+            if len(overall) < 5:
+                overall.append(s)
+            # 2. Human Only / 3. Specific LLMs
+            if s.player_type == "human":
+                bucket = human
+            elif s.player_type == "llm":
+                bucket = providers.get(s.player_name.lower())
+            else:
+                continue
+            if bucket is not None and len(bucket) < 5:
+                bucket.append(s)
         
-        # 3. Specific LLMs
-        llm_providers = ["openai", "claude", "gemini", "ollama"]
-        for provider in llm_providers:
-            data[provider] = self.get_scores_by_category(board_size, "llm", provider)[:5]
-            
-        return data
+        return {"overall": overall, "human": human, **providers}
 
 # Global instance required by other files
 enhanced_leaderboard = EnhancedLeaderboard()
\ No newline at end of file
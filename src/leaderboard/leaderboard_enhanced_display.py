@@ -1,7 +1,16 @@
 import pygame
 import sys
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Optional
 from leaderboard.leaderboard_enhanced import enhanced_leaderboard, EnhancedScore
+from config.config import BOARD_SIZES
+
+@lru_cache(maxsize=4096)
+def _render_cached(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """Antialiased font.render, memoized and converted to the display format;
+    the same labels are drawn every frame. Needs a display mode to be set."""
+    return font.render(text, True, color).convert_alpha()
 
 class EnhancedLeaderboardDisplay:
     """Enhanced leaderboard display with board size selection and categorized results"""
@@ -38,6 +47,34 @@ class EnhancedLeaderboardDisplay:
         # State
         self.current_board_size = None
         self.leaderboard_data = {}
+        self._canvas: Optional[pygame.Surface] = None  # pre-rendered leaderboard content
+        self._score_counts: Dict[int, int] = {}  # board size -> number of scores, filled on screen entry
+        self._size_buttons = self._size_button_rects()
+        self._hovered_size: Optional[int] = None
+        self._rrect_cache: Dict[tuple, pygame.Surface] = {}  # rounded-rect sprites by size/colors
+    
+    def _size_button_rects(self) -> List[tuple]:
+        """(size, rect) for each board size button on the selection screen"""
+        cols = 3
+        button_width = 150
+        button_height = 60
+        spacing = 20
+        start_y = 200
+        
+        # Center the grid
+        total_width = cols * button_width + (cols - 1) * spacing
+        start_x = (800 - total_width) // 2
+        
+        buttons = []
+        for i, size in enumerate(BOARD_SIZES):
+            row = i // cols
+            col = i % cols
+            
+            x = start_x + col * (button_width + spacing)
+            y = start_y + row * (button_height + spacing)
+            
+            buttons.append((size, pygame.Rect(x, y, button_width, button_height)))
+        return buttons
     
     def _init_fonts(self):
         """Initialize fonts with fallbacks"""
@@ -70,19 +107,38 @@ class EnhancedLeaderboardDisplay:
     
     def draw_rounded_rect(self, surface, rect, color, border_radius=8, border_color=None, border_width=0):
         """Draw rounded rectangle with optional border"""
-        pygame.draw.rect(surface, color, rect, border_radius=border_radius)
-        if border_color and border_width > 0:
-            pygame.draw.rect(surface, border_color, rect, border_width, border_radius=border_radius)
+        # Only a handful of distinct shapes are ever drawn: rasterize each once and blit it
+        key = (rect.width, rect.height, color, border_radius, border_color, border_width)
+        sprite = self._rrect_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(rect.size, pygame.SRCALPHA)
+            local = sprite.get_rect()
+            pygame.draw.rect(sprite, color, local, border_radius=border_radius)
+            if border_color and border_width > 0:
+                pygame.draw.rect(sprite, border_color, local, border_width, border_radius=border_radius)
+            sprite = sprite.convert_alpha()
+            self._rrect_cache[key] = sprite
+        surface.blit(sprite, rect.topleft)
+    
+    def _wait_events(self) -> list:
+        """Sleep until input arrives (at most 100 ms) and return the pending events.
+        An empty list means nothing happened, so there is nothing new to draw."""
+        event = pygame.event.wait(100)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
     
     def show_board_size_selection(self) -> Optional[int]:
         """Show board size selection interface"""
-        pygame.init()
+        if not pygame.get_init():
+            pygame.init()
         self.screen = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("ZIP Puzzle - Select Board Size for Leaderboard")
         
         # Get available board sizes
-        available_sizes = enhanced_leaderboard.get_available_board_sizes()
-        from config.config import BOARD_SIZES
+        available_sizes = enhanced_leaderboard.get_available_board_sizes()  # also loads the scores
+        # One pass over all scores instead of a filter per size
+        self._score_counts = Counter(s.board_size for s in enhanced_leaderboard.scores)
         all_sizes = BOARD_SIZES
         
         if not available_sizes:
@@ -91,11 +147,13 @@ class EnhancedLeaderboardDisplay:
             return None
         
         selected_size = None
+        self._hovered_size = self._size_button_at(pygame.mouse.get_pos(), available_sizes)
+        dirty = True
         
         while selected_size is None:
-            self.clock.tick(60)
-            
-            for event in pygame.event.get():
+            self.clock.tick(30)  # static screen, no animation to keep smooth
+            # Only hover changes alter this screen, and those arrive as mouse motion events
+            for event in self._wait_events():
                 if event.type == pygame.QUIT:
                     return None
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -103,79 +161,74 @@ class EnhancedLeaderboardDisplay:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     mouse_pos = pygame.mouse.get_pos()
                     selected_size = self._handle_size_selection_click(mouse_pos, available_sizes)
-            
-            self._draw_size_selection_screen(available_sizes, all_sizes)
-            pygame.display.flip()
+                elif event.type == pygame.MOUSEMOTION:
+                    hovered = self._size_button_at(event.pos, available_sizes)
+                    if hovered != self._hovered_size:
+                        self._hovered_size = hovered
+                        dirty = True
+                elif event.type == pygame.WINDOWEXPOSED:
+                    dirty = True
+            
+            if dirty:
+                self._draw_size_selection_screen(available_sizes, all_sizes)
+                pygame.display.flip()
+                dirty = False
         
         return selected_size
     
     def _show_no_scores_message(self):
         """Show message when no scores are available"""
-        for _ in range(180):  # Show for 3 seconds at 60fps
-            self.clock.tick(60)
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    return
-            
-            self.screen.fill(self.colors['bg'])
-            
-            # Title
-            title = self.fonts['title'].render("Leaderboard", True, self.colors['text_primary'])
-            title_rect = title.get_rect(center=(400, 200))
-            self.screen.blit(title, title_rect)
-            
-            # Message
-            message = self.fonts['section_header'].render("No scores recorded yet!", True, self.colors['text_secondary'])
-            message_rect = message.get_rect(center=(400, 280))
-            self.screen.blit(message, message_rect)
-            
-            hint = self.fonts['table_data'].render("Play some games to see results here", True, self.colors['text_secondary'])
-            hint_rect = hint.get_rect(center=(400, 320))
-            self.screen.blit(hint, hint_rect)
-            
-            pygame.display.flip()
+        # The message is static: draw it once, then sleep on events for up to 3 seconds
+        self._draw_no_scores_message()
+        deadline = pygame.time.get_ticks() + 3000
+        while (remaining := deadline - pygame.time.get_ticks()) > 0:
+            event = pygame.event.wait(remaining)
+            if event.type == pygame.QUIT:
+                return
+            elif event.type == pygame.KEYDOWN:
+                return
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._draw_no_scores_message()
+    
+    def _draw_no_scores_message(self):
+        """Draw and present the no-scores message"""
+        self.screen.fill(self.colors['bg'])
+        
+        # Title
+        title = _render_cached(self.fonts['title'], "Leaderboard", self.colors['text_primary'])
+        title_rect = title.get_rect(center=(400, 200))
+        self.screen.blit(title, title_rect)
+        
+        # Message
+        message = _render_cached(self.fonts['section_header'], "No scores recorded yet!", self.colors['text_secondary'])
+        message_rect = message.get_rect(center=(400, 280))
+        self.screen.blit(message, message_rect)
+        
+        hint = _render_cached(self.fonts['table_data'], "Play some games to see results here", self.colors['text_secondary'])
+        hint_rect = hint.get_rect(center=(400, 320))
+        self.screen.blit(hint, hint_rect)
+        
+        pygame.display.flip()
     
     def _draw_size_selection_screen(self, available_sizes: List[int], all_sizes: List[int]):
         """Draw the board size selection screen"""
         self.screen.fill(self.colors['bg'])
+        blits = []  # buttons are drawn first, then all text in one batch
         
         # Title
-        title = self.fonts['title'].render("Select Board Size", True, self.colors['text_primary'])
+        title = _render_cached(self.fonts['title'], "Select Board Size", self.colors['text_primary'])
         title_rect = title.get_rect(center=(400, 80))
-        self.screen.blit(title, title_rect)
+        blits.append((title, title_rect))
         
-        subtitle = self.fonts['table_data'].render("Choose a board size to view leaderboard", True, self.colors['text_secondary'])
+        subtitle = _render_cached(self.fonts['table_data'], "Choose a board size to view leaderboard", self.colors['text_secondary'])
         subtitle_rect = subtitle.get_rect(center=(400, 120))
-        self.screen.blit(subtitle, subtitle_rect)
+        blits.append((subtitle, subtitle_rect))
         
         # Board size buttons
-        cols = 3
-        button_width = 150
-        button_height = 60
-        spacing = 20
-        start_y = 200
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for i, size in enumerate(all_sizes):
-            row = i // cols
-            col = i % cols
-            
-            # Center the grid
-            total_width = cols * button_width + (cols - 1) * spacing
-            start_x = (800 - total_width) // 2
-            
-            x = start_x + col * (button_width + spacing)
-            y = start_y + row * (button_height + spacing)
-            
-            button_rect = pygame.Rect(x, y, button_width, button_height)
-            
+        for size, button_rect in self._size_buttons:
             # Button state
             is_available = size in available_sizes
-            is_hovered = button_rect.collidepoint(mouse_pos) and is_available
+            is_hovered = size == self._hovered_size
             
             # Button colors
             if not is_available:
@@ -192,52 +245,38 @@ class EnhancedLeaderboardDisplay:
             self.draw_rounded_rect(self.screen, button_rect, bg_color, border_radius=8)
             
             # Button text
-            text = self.fonts['button'].render(f"{size}x{size}", True, text_color)
+            text = _render_cached(self.fonts['button'], f"{size}x{size}", text_color)
             text_rect = text.get_rect(center=button_rect.center)
-            self.screen.blit(text, text_rect)
+            blits.append((text, text_rect))
             
             # Score count for available sizes
             if is_available:
-                count = len(enhanced_leaderboard.get_scores_by_board_size(size))
-                count_text = self.fonts['small'].render(f"{count} scores", True, text_color)
+                count = self._score_counts[size]
+                count_text = _render_cached(self.fonts['small'], f"{count} scores", text_color)
                 count_rect = count_text.get_rect(center=(button_rect.centerx, button_rect.bottom - 15))
-                self.screen.blit(count_text, count_rect)
+                blits.append((count_text, count_rect))
         
         # Instructions
-        instruction = self.fonts['table_data'].render("Blue buttons have recorded scores | Gray buttons have no scores yet", 
-                                                     True, self.colors['text_secondary'])
+        instruction = _render_cached(self.fonts['table_data'], "Blue buttons have recorded scores | Gray buttons have no scores yet", 
+                                                     self.colors['text_secondary'])
         instruction_rect = instruction.get_rect(center=(400, 500))
-        self.screen.blit(instruction, instruction_rect)
+        blits.append((instruction, instruction_rect))
         
-        back_instruction = self.fonts['table_data'].render("Press ESC to go back", True, self.colors['text_secondary'])
+        back_instruction = _render_cached(self.fonts['table_data'], "Press ESC to go back", self.colors['text_secondary'])
         back_rect = back_instruction.get_rect(center=(400, 530))
-        self.screen.blit(back_instruction, back_rect)
+        blits.append((back_instruction, back_rect))
+        
+        self.screen.blits(blits, doreturn=False)
     
     def _handle_size_selection_click(self, mouse_pos: tuple, available_sizes: List[int]) -> Optional[int]:
         """Handle clicks on board size selection"""
-        from config.config import BOARD_SIZES
-        all_sizes = BOARD_SIZES
-        
-        cols = 3
-        button_width = 150
-        button_height = 60
-        spacing = 20
-        start_y = 200
-        
-        for i, size in enumerate(all_sizes):
+        return self._size_button_at(mouse_pos, available_sizes)
+    
+    def _size_button_at(self, mouse_pos: tuple, available_sizes: List[int]) -> Optional[int]:
+        """Board size of the available button under mouse_pos, if any"""
+        for size, button_rect in self._size_buttons:
             if size not in available_sizes:
                 continue
-                
-            row = i // cols
-            col = i % cols
-            
-            total_width = cols * button_width + (cols - 1) * spacing
-            start_x = (800 - total_width) // 2
-            
-            x = start_x + col * (button_width + spacing)
-            y = start_y + row * (button_height + spacing)
-            
-            button_rect = pygame.Rect(x, y, button_width, button_height)
             
             if button_rect.collidepoint(mouse_pos):
                 return size
@@ -246,22 +285,28 @@ class EnhancedLeaderboardDisplay:
     
     def show_leaderboard(self, board_size: int):
         """Show the comprehensive leaderboard for selected board size"""
-        pygame.init()
+        if not pygame.get_init():
+            pygame.init()
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption(f"ZIP Puzzle - Leaderboard ({board_size}x{board_size})")
         
         self.current_board_size = board_size
         self.leaderboard_data = enhanced_leaderboard.get_leaderboard_data(board_size)
+        self._score_counts[board_size] = len(enhanced_leaderboard.get_scores_by_category(board_size, "overall"))
+        self._render_full_canvas()
         
         scroll_y = 0
         max_scroll = self._calculate_content_height() - self.screen_height + 100
         scroll_speed = 30
+        dirty = True  # the screen only changes when it scrolls (or needs repainting)
         
         running = True
         while running:
             self.clock.tick(60)
+            events = self._wait_events()
             
-            for event in pygame.event.get():
+            prev_scroll = scroll_y
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -276,9 +321,13 @@ class EnhancedLeaderboardDisplay:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if self._handle_leaderboard_click(event.pos):
                         running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    dirty = True
             
-            self._draw_leaderboard_screen(scroll_y)
-            pygame.display.flip()
+            if dirty or scroll_y != prev_scroll:
+                self._draw_leaderboard_screen(scroll_y)
+                pygame.display.update()
+                dirty = False
         
         pygame.quit()
     
@@ -289,14 +338,17 @@ class EnhancedLeaderboardDisplay:
         sections = 6  # Overall, Human, ChatGPT, Claude, Gemini, Ollama
         return base_height + sections * section_height
     
-    def _draw_leaderboard_screen(self, scroll_y: int):
-        """Draw the main leaderboard screen"""
-        self.screen.fill(self.colors['bg'])
+    def _render_full_canvas(self):
+        """Draw the header and all sections once onto a full-height canvas"""
+        # Tall enough to fill the window even at the maximum scroll offset
+        height = max(self._calculate_content_height() + 100, self.screen_height)
+        canvas = pygame.Surface((self.screen_width, height))
+        canvas.fill(self.colors['bg'])
         
-        current_y = -scroll_y
+        current_y = 0
         
         # Header
-        current_y = self._draw_header(current_y)
+        current_y = self._draw_header(canvas, current_y)
         
         # Sections
         sections = [
@@ -309,83 +361,96 @@ class EnhancedLeaderboardDisplay:
         ]
         
         for title, key, color in sections:
-            current_y = self._draw_section(title, self.leaderboard_data[key], current_y, color)
+            current_y = self._draw_section(canvas, title, self.leaderboard_data[key], current_y, color)
+        
+        self._canvas = canvas
+    
+    def _draw_leaderboard_screen(self, scroll_y: int):
+        """Draw the main leaderboard screen: the visible part of the canvas plus the scrollbar"""
+        self.screen.blit(self._canvas, (0, -scroll_y))
         
         # Scrollbar
         self._draw_scrollbar(scroll_y)
     
-    def _draw_header(self, y: int) -> int:
+    def _draw_header(self, surface: pygame.Surface, y: int) -> int:
         """Draw the leaderboard header"""
-        if y > self.screen_height or y + 150 < 0:
+        if y > surface.get_height() or y + 150 < 0:
             return y + 150
         
         # Background
         header_rect = pygame.Rect(0, y, self.screen_width, 150)
-        pygame.draw.rect(self.screen, self.colors['card'], header_rect)
+        pygame.draw.rect(surface, self.colors['card'], header_rect)
+        blits = []
         
         # Title
-        title = self.fonts['title'].render(f"Leaderboard - {self.current_board_size}x{self.current_board_size}", 
-                                          True, self.colors['text_primary'])
+        title = _render_cached(self.fonts['title'], f"Leaderboard - {self.current_board_size}x{self.current_board_size}", 
+                                          self.colors['text_primary'])
         title_rect = title.get_rect(center=(self.screen_width // 2, y + 40))
-        self.screen.blit(title, title_rect)
+        blits.append((title, title_rect))
         
         # Stats
-        total_scores = len(enhanced_leaderboard.get_scores_by_board_size(self.current_board_size))
-        stats_text = self.fonts['table_data'].render(f"Total Scores: {total_scores}", 
-                                                     True, self.colors['text_secondary'])
+        total_scores = self._score_counts[self.current_board_size]
+        stats_text = _render_cached(self.fonts['table_data'], f"Total Scores: {total_scores}", 
+                                                     self.colors['text_secondary'])
         stats_rect = stats_text.get_rect(center=(self.screen_width // 2, y + 80))
-        self.screen.blit(stats_text, stats_rect)
+        blits.append((stats_text, stats_rect))
         
         # Instructions
-        instruction = self.fonts['small'].render("Use mouse wheel or arrow keys to scroll | ESC to close", 
-                                                True, self.colors['text_secondary'])
+        instruction = _render_cached(self.fonts['small'], "Use mouse wheel or arrow keys to scroll | ESC to close", 
+                                                self.colors['text_secondary'])
         instruction_rect = instruction.get_rect(center=(self.screen_width // 2, y + 110))
-        self.screen.blit(instruction, instruction_rect)
+        blits.append((instruction, instruction_rect))
+        surface.blits(blits, doreturn=False)
         
         # Border
-        pygame.draw.line(self.screen, self.colors['border'], (0, y + 149), (self.screen_width, y + 149), 2)
+        pygame.draw.line(surface, self.colors['border'], (0, y + 149), (self.screen_width, y + 149), 2)
         
         return y + 150
     
-    def _draw_section(self, title: str, scores: List[EnhancedScore], y: int, color: tuple) -> int:
+    def _draw_section(self, surface: pygame.Surface, title: str, scores: List[EnhancedScore], y: int, color: tuple) -> int:
         """Draw a leaderboard section"""
         section_height = 220
         
-        if y > self.screen_height or y + section_height < 0:
+        if y > surface.get_height() or y + section_height < 0:
             return y + section_height
         
         # Section header
         header_rect = pygame.Rect(40, y + 20, self.screen_width - 80, 40)
-        self.draw_rounded_rect(self.screen, header_rect, color, border_radius=8)
+        self.draw_rounded_rect(surface, header_rect, color, border_radius=8)
         
-        header_text = self.fonts['section_header'].render(title, True, self.colors['header_text'])
+        header_text = _render_cached(self.fonts['section_header'], title, self.colors['header_text'])
         header_text_rect = header_text.get_rect(center=header_rect.center)
-        self.screen.blit(header_text, header_text_rect)
+        surface.blit(header_text, header_text_rect)
         
         # Table
         table_y = y + 70
-        self._draw_table(scores, table_y)
+        self._draw_table(surface, scores, table_y)
         
         return y + section_height
     
-    def _draw_table(self, scores: List[EnhancedScore], y: int):
+    def _draw_table(self, surface: pygame.Surface, scores: List[EnhancedScore], y: int):
         """Draw a scores table"""
+        if y > surface.get_height() or y + 130 < 0:
+            return
+        
         if not scores:
             # No scores message
-            no_scores = self.fonts['table_data'].render("No scores recorded yet", 
-                                                       True, self.colors['text_secondary'])
+            no_scores = _render_cached(self.fonts['table_data'], "No scores recorded yet", 
+                                                       self.colors['text_secondary'])
             no_scores_rect = no_scores.get_rect(center=(self.screen_width // 2, y + 60))
-            self.screen.blit(no_scores, no_scores_rect)
+            surface.blit(no_scores, no_scores_rect)
             return
         
+        blits = []  # text is blitted in one batch at the end
+        
         # Table dimensions
         table_rect = pygame.Rect(40, y, self.screen_width - 80, 130)
-        self.draw_rounded_rect(self.screen, table_rect, self.colors['card'], border_radius=8, 
+        self.draw_rounded_rect(surface, table_rect, self.colors['card'], border_radius=8, 
                               border_color=self.colors['border'], border_width=1)
         
         # Table header
         header_rect = pygame.Rect(40, y, self.screen_width - 80, 30)
-        self.draw_rounded_rect(self.screen, header_rect, self.colors['table_header'], border_radius=8)
+        self.draw_rounded_rect(surface, header_rect, self.colors['table_header'], border_radius=8)
         
         # Column headers
         col_widths = [60, 250, 120, 100, 100, 120, 120]  # Rank, Player, Model, Time, Score, Efficiency, Accuracy
@@ -394,9 +459,9 @@ class EnhancedLeaderboardDisplay:
         headers = ["Rank", "Player", "Model", "Time", "Score", "Efficiency", "Accuracy"]
         for i, (header, width) in enumerate(zip(headers, col_widths)):
             if col_x + width <= self.screen_width - 50:
-                text = self.fonts['table_header'].render(header, True, self.colors['text_primary'])
+                text = _render_cached(self.fonts['table_header'], header, self.colors['text_primary'])
                 text_rect = pygame.Rect(col_x, y + 5, width, 20)
-                self.screen.blit(text, (col_x + 5, y + 8))
+                blits.append((text, (col_x + 5, y + 8)))
                 col_x += width
         
         # Table rows
@@ -409,47 +474,49 @@ class EnhancedLeaderboardDisplay:
             
             # Alternating row colors
             if i % 2 == 1:
-                pygame.draw.rect(self.screen, self.colors['table_row_alt'], row_rect)
+                pygame.draw.rect(surface, self.colors['table_row_alt'], row_rect)
             
             # Row data
             col_x = 50
             
             # Rank
-            rank_text = self.fonts['table_data'].render(f"#{i+1}", True, self.colors['text_primary'])
-            self.screen.blit(rank_text, (col_x + 5, row_y + 3))
+            rank_text = _render_cached(self.fonts['table_data'], f"#{i+1}", self.colors['text_primary'])
+            blits.append((rank_text, (col_x + 5, row_y + 3)))
             col_x += col_widths[0]
             
             # Player
-            player_text = self.fonts['table_data'].render(score.display_name()[:25], True, self.colors['text_primary'])
-            self.screen.blit(player_text, (col_x + 5, row_y + 3))
+            player_text = _render_cached(self.fonts['table_data'], score.display_name()[:25], self.colors['text_primary'])
+            blits.append((player_text, (col_x + 5, row_y + 3)))
             col_x += col_widths[1]
             
             # Model
             model_text = score.model_name if score.model_name else "Human"
-            model_display = self.fonts['table_data'].render(model_text[:15], True, self.colors['text_secondary'])
-            self.screen.blit(model_display, (col_x + 5, row_y + 3))
+            model_display = _render_cached(self.fonts['table_data'], model_text[:15], self.colors['text_secondary'])
+            blits.append((model_display, (col_x + 5, row_y + 3)))
             col_x += col_widths[2]
             
             # Time
-            time_text = self.fonts['table_data'].render(f"{score.time_seconds}s", True, self.colors['text_primary'])
-            self.screen.blit(time_text, (col_x + 5, row_y + 3))
+            time_text = _render_cached(self.fonts['table_data'], f"{score.time_seconds}s", self.colors['text_primary'])
+            blits.append((time_text, (col_x + 5, row_y + 3)))
             col_x += col_widths[3]
             
             # Score
-            score_text = self.fonts['table_data'].render(f"{score.score():.1f}", True, self.colors['text_primary'])
-            self.screen.blit(score_text, (col_x + 5, row_y + 3))
+            score_text = _render_cached(self.fonts['table_data'], f"{score.score():.1f}", self.colors['text_primary'])
+            blits.append((score_text, (col_x + 5, row_y + 3)))
             col_x += col_widths[4]
             
             # Efficiency (for LLMs)
             if score.player_type != "human":
-                eff_text = self.fonts['table_data'].render(f"{score.move_efficiency:.1%}", True, self.colors['text_secondary'])
-                self.screen.blit(eff_text, (col_x + 5, row_y + 3))
+                eff_text = _render_cached(self.fonts['table_data'], f"{score.move_efficiency:.1%}", self.colors['text_secondary'])
+                blits.append((eff_text, (col_x + 5, row_y + 3)))
             col_x += col_widths[5]
             
             # Accuracy (for LLMs)
             if score.player_type != "human":
-                acc_text = self.fonts['table_data'].render(f"{score.path_accuracy:.1%}", True, self.colors['text_secondary'])
-                self.screen.blit(acc_text, (col_x + 5, row_y + 3))
+                acc_text = _render_cached(self.fonts['table_data'], f"{score.path_accuracy:.1%}", self.colors['text_secondary'])
+                blits.append((acc_text, (col_x + 5, row_y + 3)))
+        
+        surface.blits(blits, doreturn=False)
     
     def _draw_scrollbar(self, scroll_y: int):
         """Draw scrollbar"""
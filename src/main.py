@@ -1,18 +1,11 @@
-import pygame
 import sys
 import os
 from config.config import *
 from core.generator import generate_unique_puzzle
 from core.board import Board
-from UI.GUI import Game
 
-# Try to import the improved menu system
-try:
-    from UI.menu import show_modern_menu
-    USE_MODERN_MENU = True
-except ImportError:
-    USE_MODERN_MENU = False
-    print("Modern menu not available, using fallback")
+# pygame and the UI modules are imported where they are used, so importing
+# this module (e.g. from headless tools) doesn't pull in SDL
 
 def start_game_with_settings(board_size, mode_or_provider):
     """Start game with specific settings"""
@@ -40,18 +33,22 @@ def start_game_with_settings(board_size, mode_or_provider):
     
     # Generate puzzle
     grid, solution, mapping = generate_unique_puzzle(n=n, diag=ADJACENCY_8_WAY)
-    inverse_mapping = {v: k for k, v in mapping.items()}
+    inverse_mapping = dict(zip(mapping.values(), mapping.keys()))
 
     board = Board(
         grid=grid, k=k, diag=ADJACENCY_8_WAY,
         display_to_step=mapping, step_to_display=inverse_mapping
     )
     
+    from UI.GUI import Game
     game = Game(board, solution=solution, board_size=n, game_mode=game_mode, llm_provider=llm_provider)
     
     if llm_provider:
         import threading
-        threading.Timer(1.0, lambda: game.solve_with_llm(llm_provider)).start()
+        def solve_when_ready():
+            game.gui_ready.wait(timeout=5)
+            game.solve_with_llm(llm_provider)
+        threading.Thread(target=solve_when_ready).start()
     
     game.run()
 
@@ -63,13 +60,19 @@ def main():
     # Just continue to the normal menu system below
         pass
 
+    # Try to import the improved menu system
+    try:
+        from UI.menu import show_modern_menu
+    except ImportError:
+        print("Modern menu not available, using fallback")
+        return
+
     # Normal startup OR "Select Board Size" button clicked - show existing menu
-    if USE_MODERN_MENU:
-        result = show_modern_menu()
-        if result and len(result) == 2:
-            n, mode = result
-            if n and mode:
-                start_game_with_settings(n, mode)
+    result = show_modern_menu()
+    if result and len(result) == 2:
+        n, mode = result
+        if n and mode:
+            start_game_with_settings(n, mode)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -106,7 +106,7 @@ def test_puzzle_generation():
             k=9,
             diag=False,
             display_to_step=mapping,
-            step_to_display={v: k for k, v in mapping.items()}
+            step_to_display=dict(zip(mapping.values(), mapping.keys()))
         )
 
         print(f"✅ Generated 3x3 puzzle with {len(board.givens())} clues")
@@ -14,31 +14,49 @@ FEATURES:
 import time
 import argparse
 import logging
+import logging.handlers
+import queue
+import atexit
 import sys
 import os
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# wandb (optional)
 try:
-    import wandb
-    WANDB_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WANDB_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # ZIP imports
 from config.config import BOARD_SIZES, ADJACENCY_8_WAY
-from config.llm_config import LLM_PROVIDERS, ENABLE_WANDB, WANDB_PROJECT
+from config.llm_config import (
+    LLM_PROVIDERS, ENABLE_WANDB, WANDB_PROJECT, LLM_MOVES_PER_CALL, LLM_MAX_MOVES_PER_CALL,
+    LLM_PARALLEL_GAMES, LLM_RESPONSE_CACHE_FILE,
+)
 from core.generator import generate_unique_puzzle
 from core.board import Board, validate_path
 
-# FIXED imports
-from LLM_configuration.llm_manager import llm_solver
-from evaluation.eval import llm_metrics_collector
+# The GUI (pygame), the LLM clients, the metrics collector and wandb are
+# imported where they are used, so headless runs and tools that only
+# import this module don't load them up front.
+
+# wandb (optional), set by _load_wandb() when ENABLE_WANDB is on
+wandb = None
+
 
-# GUI Engine
-from UI.GUI import Game
+def _load_wandb():
+    """Import wandb into this module; returns None if it isn't installed"""
+    global wandb
+    try:
+        import wandb as _wandb
+    except ImportError:
+        return None
+    wandb = _wandb
+    return wandb
 
 
 # ------------------------------------------------------------
@@ -84,6 +102,21 @@ def parse_args():
 
     parser.add_argument("--max-moves", type=int, default=DEFAULT_MAX_MOVES)
     parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT)
+    parser.add_argument(
+        "--moves-per-call", type=int, default=LLM_MOVES_PER_CALL,
+        choices=range(1, LLM_MAX_MOVES_PER_CALL + 1), metavar=f"1..{LLM_MAX_MOVES_PER_CALL}",
+        help="Headless mode: moves requested per LLM call; the rest are queued "
+             "and the LLM is asked again once the queue is empty or a move is invalid"
+    )
+    parser.add_argument(
+        "--parallel-games", type=int, default=LLM_PARALLEL_GAMES,
+        help="Headless mode: number of games played at the same time"
+    )
+    parser.add_argument(
+        "--llm-cache", action="store_true",
+        help=f"Reuse LLM replies to identical prompts, kept across runs in {LLM_RESPONSE_CACHE_FILE} "
+             "(repeated games then replay the same answers)"
+    )
 
     return parser.parse_args()
 
@@ -120,8 +153,14 @@ def setup_logging(level, provider=None, board_size=None):
     file_handler.setFormatter(formatter)
     stream_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    # Game threads only enqueue records; a listener thread does the
+    # formatting and the file/console writes
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
@@ -138,7 +177,7 @@ def generate_puzzle(board_size: int):
         n=board_size,
         diag=ADJACENCY_8_WAY
     )
-    inverse = {v: k for k, v in mapping.items()}
+    inverse = dict(zip(mapping.values(), mapping.keys()))
 
     board = Board(
         grid=grid,
@@ -154,10 +193,13 @@ def generate_puzzle(board_size: int):
 # SINGLE GAME — GUI MODE
 # ------------------------------------------------------------
 
-def run_single_game_gui(game_id, board_size, provider, max_moves, timeout, logger):
+def run_single_game_gui(game_id, board_size, provider, max_moves, timeout, logger, puzzle=None):
     logger.info(f"=== GAME {game_id+1} — GUI MODE — {provider} ===")
 
-    board, solution = generate_puzzle(board_size)
+    from UI.GUI import Game
+    from evaluation.eval import llm_metrics_collector
+
+    board, solution = puzzle or generate_puzzle(board_size)
 
     game = Game(
         board=board,
@@ -172,11 +214,12 @@ def run_single_game_gui(game_id, board_size, provider, max_moves, timeout, logge
     game.llm_max_moves = max_moves
     game.llm_timeout = timeout
 
-    # Start solving in background thread
-    solver_thread = threading.Thread(
-        target=lambda: game.solve_with_llm(provider),
-        daemon=True
-    )
+    # Start solving in background thread once the first frame is up
+    def solve_when_ready():
+        game.gui_ready.wait(timeout=5)
+        game.solve_with_llm(provider)
+
+    solver_thread = threading.Thread(target=solve_when_ready, daemon=True)
     solver_thread.start()
 
     # GUI loop (returns when auto-quit triggers)
@@ -201,61 +244,81 @@ def run_single_game_gui(game_id, board_size, provider, max_moves, timeout, logge
 # SINGLE GAME — HEADLESS MODE
 # ------------------------------------------------------------
 
-def run_single_game_headless(game_id, board_size, provider, max_moves, timeout, logger):
+def run_single_game_headless(game_id, board_size, provider, max_moves, timeout, logger, moves_per_call=1,
+                             metrics_collector=None, puzzle=None):
     logger.info(f"=== GAME {game_id+1} — HEADLESS MODE — {provider} ===")
 
-    board, solution = generate_puzzle(board_size)
+    from LLM_configuration.llm_manager import llm_solver
+    from evaluation.eval import llm_metrics_collector
+
+    # Games played in parallel each bring their own collector
+    if metrics_collector is not None:
+        llm_metrics_collector = metrics_collector
+
+    board, solution = puzzle or generate_puzzle(board_size)
     givens = board.givens()
 
     if 1 not in givens:
         raise RuntimeError("Puzzle missing clue 1!")
 
     path = [givens[1]]
+    visited = {givens[1]}  # same cells as path, for O(1) revisit checks
     move_count = 0
     is_won = False
     stuck_count = 0
     max_stuck = 3
-    start_time = time.time()
+    pending = deque()  # moves from the last LLM reply not played yet
+    # Monotonic clock: immune to wall-clock (NTP) adjustments mid-game
+    start_ns = time.monotonic_ns()
+    timeout_ns = int(timeout * 1_000_000_000)
 
     llm_metrics_collector.start_game(board_size, solution)
-    llm_solver.set_provider(provider)
 
     while not is_won and move_count < max_moves and stuck_count < max_stuck:
 
-        if time.time() - start_time > timeout:
+        if time.monotonic_ns() - start_ns > timeout_ns:
             logger.warning("Timeout reached.")
             break
 
         move_count += 1
 
         llm_metrics_collector.start_move()
-        result = llm_solver.solve(board, path, len(path) + 1)
+        from_reply = not pending
+        if from_reply:
+            result = llm_solver.solve(board, path, len(path) + 1, moves_ahead=moves_per_call)
 
-        if not result or "next_move" not in result:
-            stuck_count += 1
-            continue
+            if not result or "next_move" not in result:
+                stuck_count += 1
+                continue
+
+            pending.extend(result.get("next_moves") or [result["next_move"]])
 
-        r, c = result["next_move"]["row"], result["next_move"]["col"]
+        move = pending.popleft()
+        r, c = move["row"], move["col"]
         cell = (r, c)
 
         is_valid = (
-            cell not in path
-            and cell in board.neighbors(path[-1][0], path[-1][1], board.diag)
+            cell not in visited
+            and board.is_adjacent(path[-1], cell)
         )
 
+        # record_move only reads the path (before this move), so no copy is needed
         llm_metrics_collector.record_move(
             row=r,
             col=c,
             is_valid=is_valid,
-            path_before=path.copy(),
-            reason=result.get("reason", ""),
+            current_path=path,
+            reasoning=result.get("reason", ""),
             confidence=result.get("confidence", 0.5),
             parsing_success=result.get("parsing_success", True),
-            response_length=result.get("response_length", 0),
+            response_length=result.get("response_length", 0) if from_reply else 0,
+            from_reply=from_reply,
+            visited=visited,
         )
 
         if is_valid:
             path.append(cell)
+            visited.add(cell)
             stuck_count = 0
             if len(path) == board.k:
                 ok, _ = validate_path(board, path)
@@ -263,6 +326,8 @@ def run_single_game_headless(game_id, board_size, provider, max_moves, timeout,
                     is_won = True
         else:
             stuck_count += 1
+            # The rest of the sequence was planned from a position we never reached
+            pending.clear()
 
     metrics = llm_metrics_collector.end_game(is_won)
 
@@ -271,7 +336,7 @@ def run_single_game_headless(game_id, board_size, provider, max_moves, timeout,
         "success": is_won,
         "moves": move_count,
         "path_length": len(path),
-        "completion_time": time.time() - start_time,
+        "completion_time": (time.monotonic_ns() - start_ns) / 1e9,
         "move_efficiency": getattr(metrics, "move_efficiency", 0),
         "path_accuracy": getattr(metrics, "path_accuracy", 0),
         "board_size": board_size,
@@ -283,32 +348,64 @@ def run_single_game_headless(game_id, board_size, provider, max_moves, timeout,
 # BATCH RUNNER
 # ------------------------------------------------------------
 
-def run_batch(num_runs, board_size, provider, gui_mode, max_moves, timeout, logger):
+def run_batch(num_runs, board_size, provider, gui_mode, max_moves, timeout, logger, moves_per_call=1,
+              parallel_games=1):
+    from evaluation.eval import llm_metrics_collector, LLMMetricsCollector
+
     results = []
     success_count = 0
 
     cumulative_eff = 0.0
     cumulative_acc = 0.0
 
-    for i in range(num_runs):
-
-        print("\n" + "=" * 50)
-        print(f"▶ STARTING RUN {i+1} OF {num_runs}")
-        print("=" * 50)
-
-        llm_metrics_collector.start_game(board_size)
+    def play(i, collector, puzzle=None):
+        # One write, so parallel games' banners don't interleave
+        print("\n" + "=" * 50 + f"\n▶ STARTING RUN {i+1} OF {num_runs}\n" + "=" * 50)
 
         if gui_mode:
-            result = run_single_game_gui(i, board_size, provider, max_moves, timeout, logger)
+            result = run_single_game_gui(i, board_size, provider, max_moves, timeout, logger, puzzle)
         else:
-            result = run_single_game_headless(i, board_size, provider, max_moves, timeout, logger)
+            result = run_single_game_headless(i, board_size, provider, max_moves, timeout, logger,
+                                              moves_per_call, collector, puzzle)
+        return result, collector.game_metrics
+
+    # The provider is fixed for the whole batch. Connect before the first game
+    # clock starts so the handshake isn't timed as move 1.
+    if not gui_mode:
+        from LLM_configuration.llm_manager import llm_solver
+        llm_solver.set_provider(provider)
+        llm_solver.warmup()
+
+    def puzzles():
+        # Generate the next puzzle in the background while the current game
+        # waits on the LLM (large boards fan out to processes in the generator)
+        with ThreadPoolExecutor(max_workers=1) as generator:
+            upcoming = generator.submit(generate_puzzle, board_size)
+            for i in range(num_runs):
+                puzzle = upcoming.result()
+                if i + 1 < num_runs:
+                    upcoming = generator.submit(generate_puzzle, board_size)
+                yield puzzle
+
+    # Headless games are independent and spend their time waiting on the LLM,
+    # so they can overlap; each gets its own metrics collector and they share
+    # llm_solver (which locks its client/cache state). Puzzles still come from
+    # the single prefetch thread, so game threads never start generator pools.
+    # Results are still reported in run order.
+    if gui_mode or parallel_games <= 1:
+        games = (play(i, llm_metrics_collector, puzzle) for i, puzzle in enumerate(puzzles()))
+        pool = None
+    else:
+        pool = ThreadPoolExecutor(max_workers=min(parallel_games, num_runs))
+        games = pool.map(lambda item: play(item[0], LLMMetricsCollector(), item[1]), enumerate(puzzles()))
+
+    for i, (result, gm) in enumerate(games):
 
         # Save result
         results.append(result)
 
         # Access game metrics dict
-        gm = llm_metrics_collector.game_metrics
-        gm_dict = gm.to_dict() if gm else {}
+        gm_dict = gm.to_dict(include_moves=False) if gm else {}
 
         # Extract metrics for averaging
         eff = gm.move_efficiency if gm else 0
@@ -321,24 +418,24 @@ def run_batch(num_runs, board_size, provider, gui_mode, max_moves, timeout, logg
         if result["success"]:
             success_count += 1
 
-        # Print detailed metrics for this run
-        print("\n📊 METRICS FOR RUN", i+1)
-        print("-" * 40)
-        for k, v in gm_dict.items():
-            if k != "moves_details":
-                print(f"{k:20}: {v}")
-
-        # Print cumulative averages so far
-        print("\n📈 AVERAGES AFTER", i+1, "RUNS")
-        print("-" * 40)
-        print(f"Avg Move Efficiency: {(cumulative_eff / (i+1)):.3f}")
-        print(f"Avg Path Accuracy:   {(cumulative_acc / (i+1)):.3f}")
-        print(f"Success Rate:        {(success_count / (i+1)):.3f}")
+        # Detailed metrics for this run, then cumulative averages so far,
+        # written to stdout in one go
+        lines = [f"\n📊 METRICS FOR RUN {i+1}", "-" * 40]
+        lines += [f"{k:20}: {v}" for k, v in gm_dict.items()]
+        lines += [
+            f"\n📈 AVERAGES AFTER {i+1} RUNS",
+            "-" * 40,
+            f"Avg Move Efficiency: {(cumulative_eff / (i+1)):.3f}",
+            f"Avg Path Accuracy:   {(cumulative_acc / (i+1)):.3f}",
+            f"Success Rate:        {(success_count / (i+1)):.3f}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         logger.info(f"[{i+1}/{num_runs}] Current success rate={success_count/(i+1):.1%}")
 
         # wandb logging per-run
-        if WANDB_AVAILABLE and ENABLE_WANDB:
+        if wandb is not None:
             wandb.log({
                 "run/id": i+1,
                 "run/success": result["success"],
@@ -347,6 +444,9 @@ def run_batch(num_runs, board_size, provider, gui_mode, max_moves, timeout, logg
                 "run/success_rate_so_far": success_count/(i+1)
             })
 
+    if pool is not None:
+        pool.shutdown()
+
     # FINAL SUMMARY RETURN
     return {
         "summary": {
@@ -396,8 +496,12 @@ def main():
     if not args.run_name:
         args.run_name = f"{args.llm_provider}-{args.board_size}x{args.board_size}-{args.num_runs}runs"
 
+    if args.llm_cache:
+        from LLM_configuration.llm_manager import llm_solver
+        llm_solver.enable_response_cache(LLM_RESPONSE_CACHE_FILE)
+
     # setup wandb
-    if ENABLE_WANDB and WANDB_AVAILABLE:
+    if ENABLE_WANDB and _load_wandb():
         wandb.init(
             project=WANDB_PROJECT,
             name=args.run_name,
@@ -406,6 +510,9 @@ def main():
                 "llm_provider": args.llm_provider,
                 "num_runs": args.num_runs,
                 "gui_mode": gui_mode,
+                "moves_per_call": args.moves_per_call,
+                "parallel_games": args.parallel_games,
+                "llm_cache": args.llm_cache,
             },
         )
 
@@ -417,19 +524,28 @@ def main():
         args.max_moves,
         args.timeout,
         logger,
+        args.moves_per_call,
+        args.parallel_games,
     )
 
     print_summary(stats, logger)
 
-    # Save results
-    import json
+    if args.llm_cache:
+        llm_solver.save_response_cache()
+
+    # Save results: one serialize and one write (json.dump issues many small writes)
     fname = f"zip_llm_results_{args.run_name}.json"
-    with open(fname, "w") as f:
-        json.dump(stats, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(fname, "wb") as f:
+            f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        with open(fname, "w") as f:
+            f.write(json.dumps(stats, indent=2))
 
     logger.info(f"Saved results to {fname}")
 
-    if WANDB_AVAILABLE:
+    if wandb is not None:
         wandb.finish()
 
     return 0